@@ -3,26 +3,46 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
+import msgspec
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
 from .db import db
-from .etl_pipeline import PathwayETLPipeline
+from .etl_pipeline import PathwayETLPipeline, parse_event_timestamp
 from .rag_assistant import RagAssistant
 from .risk_engine import DiseaseRiskEngine
-from .streaming import FileStreamSource, HTTPStreamSource, KafkaStreamSource, StreamProcessor
+from .streaming import (
+    FileStreamSource,
+    HTTPStreamSource,
+    KafkaStreamSource,
+    SSEStreamSource,
+    StreamProcessor,
+)
 
 logger = logging.getLogger(__name__)
 
+# Shared encoder for report files and WebSocket frames (avoids stdlib json on hot paths)
+_ENCODER = msgspec.json.Encoder()
+
+_PING_FRAME = _ENCODER.encode({"type": "ping"})
+
+# Redis pub/sub channel used to fan broadcasts out across Uvicorn workers
+BROADCAST_CHANNEL = "agri.telemetry"
+
+# Makes ISO timestamps filename-safe in a single pass
+_TS_TABLE = str.maketrans({":": "-", "+": "_plus_", ".": "_"})
+
 
 class ChatRequest(BaseModel):
     """Request model for chat endpoint."""
@@ -33,32 +53,148 @@ class LiveState:
     """Manages live state, connections, and data broadcasts."""
 
     def __init__(self) -> None:
-        self.etl_pipeline = PathwayETLPipeline(window_size=15)
+        # Rows are written by the batched async writer below, not per event by the pipeline
+        self.etl_pipeline = PathwayETLPipeline(
+            window_size=15, persist=False, workers=int(os.getenv("ETL_WORKERS", "1"))
+        )
         self.risk_engine = DiseaseRiskEngine()
-        self.connections: set[WebSocket] = set()
+        # Copy-on-write snapshot; only the event loop rebinds it, so no lock is needed
+        self._connections: tuple[WebSocket, ...] = ()
         self.latest: dict[str, Any] = {}
-        self.history: list[dict[str, Any]] = []
-        self.alerts: list[dict[str, Any]] = []
-        self.lock = asyncio.Lock()
+        self.history: deque[dict[str, Any]] = deque(maxlen=400)
+        self.alerts: deque[dict[str, Any]] = deque(maxlen=100)
+        self.telemetry_slot: dict[str, Any] | None = None
+        self.alert_queue: deque[dict[str, Any]] = deque()
+        self.drain_task: asyncio.Task[Any] | None = None
+        self.pending_rows: list[tuple[dict[str, Any], dict[str, Any], dict[str, Any]]] = []
+        self.rows_ready = asyncio.Event()
+        self.persist_task: asyncio.Task[Any] | None = None
+        self.assistant_task: asyncio.Task[Any] | None = None
         self.stream_task: asyncio.Task[Any] | None = None
         self.stream_processor: StreamProcessor | None = None
         self.stream_source_type: str = "uninitialized"
+        self.bus: Any = None  # redis.asyncio.Redis when REDIS_URL is set
+        self.bus_task: asyncio.Task[Any] | None = None
+
+    def add_connection(self, ws: WebSocket) -> None:
+        """Register a WebSocket client for broadcasts."""
+        self._connections = self._connections + (ws,)
+
+    def remove_connection(self, ws: WebSocket) -> None:
+        """Unregister a WebSocket client."""
+        self._connections = tuple(conn for conn in self._connections if conn is not ws)
 
     async def broadcast(self, message: dict[str, Any]) -> None:
-        """Broadcast message to all connected WebSocket clients."""
-        stale: list[WebSocket] = []
-        for ws in self.connections:
+        """Broadcast message to all connected WebSocket clients concurrently."""
+        if self._connections:
+            # Encode once per message rather than once per client
+            await self.broadcast_bytes(_ENCODER.encode(message))
+
+    async def broadcast_bytes(self, data: bytes) -> None:
+        """Send an already encoded frame to all connected WebSocket clients."""
+        connections = self._connections
+        if not connections:
+            return
+
+        results = await asyncio.gather(
+            *(ws.send_bytes(data) for ws in connections),
+            return_exceptions=True,
+        )
+        stale = {id(ws) for ws, result in zip(connections, results) if isinstance(result, Exception)}
+        if stale:
+            self._connections = tuple(ws for ws in self._connections if id(ws) not in stale)
+
+    async def drain_broadcasts(self, interval: float = 0.05) -> None:
+        """
+        Flush pending broadcasts at a fixed rate.
+        Telemetry is coalesced so clients only receive the newest snapshot per tick.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            telemetry, self.telemetry_slot = self.telemetry_slot, None
             try:
-                await ws.send_json(message)
-            except Exception:
-                stale.append(ws)
+                if telemetry is not None:
+                    await self.publish({"type": "telemetry", "payload": telemetry})
+                while self.alert_queue:
+                    await self.publish({"type": "alert", "payload": self.alert_queue.popleft()})
+            except Exception as e:
+                # A failed publish (e.g. Redis unavailable) drops this tick, not the loop
+                logger.error("Error publishing broadcast: %s", e)
+
+    async def publish(self, message: dict[str, Any]) -> None:
+        """Broadcast locally, or through the shared bus when several workers are running."""
+        if self.bus is None:
+            await self.broadcast(message)
+        else:
+            await self.bus.publish(BROADCAST_CHANNEL, _ENCODER.encode(message))
+
+    async def relay_bus(self, apply_state: bool) -> None:
+        """
+        Forward frames published on the shared bus to this worker's clients.
+        Relay-only workers also mirror the messages into their own live state.
+        """
+        pubsub = self.bus.pubsub()
+        await pubsub.subscribe(BROADCAST_CHANNEL)
+        try:
+            async for item in pubsub.listen():
+                if item["type"] != "message":
+                    continue
+                data = item["data"]
+                if apply_state:
+                    message = msgspec.json.decode(data)
+                    if message["type"] == "telemetry":
+                        self.latest = message["payload"]
+                        self.history.append(message["payload"])
+                    elif message["type"] == "alert":
+                        self.alerts.append(message["payload"])
+                await self.broadcast_bytes(data)
+        finally:
+            await pubsub.aclose()
+
+    def queue_rows(self, payload: dict[str, Any], batch_size: int = 50) -> None:
+        """Queue DB rows for an event; wakes the writer once a full batch is pending."""
+        self.pending_rows.append(_persistence_rows(payload))
+        if len(self.pending_rows) >= batch_size:
+            self.rows_ready.set()
+
+    async def flush_rows(self) -> None:
+        """Write all pending rows in a single async transaction."""
+        if not self.pending_rows:
+            return
+        rows, self.pending_rows = self.pending_rows, []
+        readings, features, risks = (list(column) for column in zip(*rows))
+        try:
+            await db.insert_batch(readings, features, risks)
+        except asyncio.CancelledError:
+            # Put the batch back so the final flush on shutdown still writes it
+            self.pending_rows[:0] = rows
+            raise
+        except Exception as e:
+            logger.error("Error persisting %d stream events: %s", len(rows), e)
+
+    async def persist_rows(self, interval: float = 1.0) -> None:
+        """Flush pending rows every `interval` seconds or as soon as a batch fills up."""
+        while True:
+            try:
+                await asyncio.wait_for(self.rows_ready.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self.rows_ready.clear()
+            await self.flush_rows()
+
 
-        for ws in stale:
-            self.connections.discard(ws)
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run startup before serving requests and shutdown afterwards."""
+    await on_startup()
+    try:
+        yield
+    finally:
+        await on_shutdown()
 
 
 # Initialize FastAPI app
-app = FastAPI(title="AgriGuardian AI - Pathway ETL + RAG Pipeline")
+app = FastAPI(title="AgriGuardian AI - Pathway ETL + RAG Pipeline", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -74,21 +210,36 @@ reports_dir = Path(__file__).resolve().parent / "high_risk_reports"
 reports_dir.mkdir(parents=True, exist_ok=True)
 
 
+def _log_report_write_error(future: asyncio.Future[Any]) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Error writing high-risk report: %s", future.exception())
+
+
+def _log_task_exit(task: asyncio.Task[Any]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task %s stopped: %s", task.get_name(), task.exception())
+
+
 def persist_high_risk_report(payload: dict[str, Any]) -> str:
-    """Persist high-risk alerts to JSON files and database."""
-    timestamp_value = str(payload.get("timestamp", datetime.now(timezone.utc).isoformat()))
-    safe_timestamp = (
-        timestamp_value.replace(":", "-")
-        .replace("+", "_plus_")
-        .replace(".", "_")
-    )
+    """
+    Persist high-risk alerts to JSON files and database.
+    The file write runs in the default executor so the event loop is not blocked.
+    """
+    timestamp_value = payload.get("timestamp")
+    if timestamp_value is None:
+        timestamp_value = datetime.now(timezone.utc).isoformat()
+    safe_timestamp = str(timestamp_value).translate(_TS_TABLE)
     file_name = f"high_risk_{safe_timestamp}.json"
     file_path = reports_dir / file_name
-    file_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    encoded = _ENCODER.encode(payload)
+    write = asyncio.get_running_loop().run_in_executor(None, file_path.write_bytes, encoded)
+    write.add_done_callback(_log_report_write_error)
     return file_name
 
 
-def _build_stream_source() -> tuple[str, KafkaStreamSource | HTTPStreamSource | FileStreamSource]:
+def _build_stream_source() -> tuple[
+    str, KafkaStreamSource | HTTPStreamSource | SSEStreamSource | FileStreamSource
+]:
     stream_source = os.getenv("STREAM_SOURCE", "kafka").strip().lower()
 
     if stream_source == "kafka":
@@ -98,6 +249,7 @@ def _build_stream_source() -> tuple[str, KafkaStreamSource | HTTPStreamSource |
                 bootstrap_servers=os.getenv("KAFKA_BROKERS", "localhost:9092"),
                 topic=os.getenv("KAFKA_TOPIC", "sensor-data"),
                 group_id=os.getenv("KAFKA_GROUP_ID", "agriguardian-consumer"),
+                value_format=os.getenv("KAFKA_VALUE_FORMAT", "json").strip().lower(),
             ),
         )
 
@@ -110,36 +262,86 @@ def _build_stream_source() -> tuple[str, KafkaStreamSource | HTTPStreamSource |
             ),
         )
 
+    if stream_source == "sse":
+        return (
+            stream_source,
+            SSEStreamSource(endpoint=os.getenv("SSE_ENDPOINT", "http://localhost:8080/api/sensors/stream")),
+        )
+
     if stream_source == "file":
         return (
             stream_source,
             FileStreamSource(file_path=os.getenv("FILE_STREAM_PATH", "./sensor_data.jsonl")),
         )
 
-    raise ValueError("Invalid STREAM_SOURCE. Use one of: kafka, http, file")
+    raise ValueError("Invalid STREAM_SOURCE. Use one of: kafka, http, sse, file")
 
 
 def _risk_payload(event: dict[str, Any], processed: dict[str, Any]) -> dict[str, Any]:
     risk = state.risk_engine.score(processed)
     timestamp = event.get("timestamp") or datetime.now(timezone.utc).isoformat()
 
-    return {
-        **event,
-        **processed,
+    payload = event.copy()
+    payload.update(processed)
+    payload["timestamp"] = timestamp
+    payload["risk_score"] = risk.risk_score
+    payload["risk_level"] = risk.risk_level
+    payload["reasons"] = risk.reasons
+    payload["suggested_actions"] = risk.suggested_actions
+    payload["predicted_disease"] = risk.predicted_disease
+    payload["disease_confidence"] = risk.disease_confidence
+    payload["disease_suggestions"] = risk.disease_suggestions
+    payload["outbreak_eta_hours"] = risk.outbreak_eta_hours
+    payload["outbreak_window"] = risk.outbreak_window
+    payload["forecast_trajectory"] = risk.forecast_trajectory
+    payload["action_plan"] = risk.action_plan
+    payload["alert_triggered"] = risk.alert_triggered
+    payload["ingestion_mode"] = state.stream_source_type
+    return payload
+
+
+def _persistence_rows(
+    payload: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """Split a risk payload into sensor reading, feature and risk rows."""
+    timestamp = parse_event_timestamp(payload.get("timestamp"))
+    crop_type = payload.get("crop_type")
+    reading = {
         "timestamp": timestamp,
-        "risk_score": risk.risk_score,
-        "risk_level": risk.risk_level,
-        "reasons": risk.reasons,
-        "suggested_actions": risk.suggested_actions,
-        "predicted_disease": risk.predicted_disease,
-        "disease_confidence": risk.disease_confidence,
-        "disease_suggestions": risk.disease_suggestions,
-        "outbreak_eta_hours": risk.outbreak_eta_hours,
-        "outbreak_window": risk.outbreak_window,
-        "forecast_trajectory": risk.forecast_trajectory,
-        "action_plan": risk.action_plan,
-        "ingestion_mode": state.stream_source_type,
+        "crop_type": crop_type,
+        "temperature": float(payload.get("temperature", 0)),
+        "humidity": float(payload.get("humidity", 0)),
+        "rain_forecast": float(payload.get("rain_forecast", 0)),
+        "soil_moisture": float(payload.get("soil_moisture", 0)),
+        "wind_speed": float(payload.get("wind_speed", 0)),
+        "leaf_wetness": float(payload.get("leaf_wetness", 0)),
+        "soil_temperature": float(payload.get("soil_temperature", 0)),
+        "soil_ph": float(payload.get("soil_ph", 0)),
+        "solar_radiation": float(payload.get("solar_radiation", 0)),
     }
+    feature = {
+        "timestamp": timestamp,
+        "crop_type": crop_type,
+        "rolling_temp_avg": payload.get("rolling_temp_avg"),
+        "rolling_humidity_avg": payload.get("rolling_humidity_avg"),
+        "rolling_leaf_wetness_avg": payload.get("rolling_leaf_wetness_avg"),
+        "humidity_alert": str(payload.get("humidity_alert")),
+        "weather_condition": payload.get("weather_condition"),
+        "anomaly_score": payload.get("anomaly_score"),
+    }
+    risk = {
+        "timestamp": timestamp,
+        "crop_type": crop_type,
+        "risk_score": payload["risk_score"],
+        "risk_level": payload["risk_level"],
+        "predicted_disease": payload["predicted_disease"],
+        "disease_confidence": payload["disease_confidence"],
+        "outbreak_eta_hours": payload["outbreak_eta_hours"],
+        "reasons": "\n".join(payload["reasons"]),
+        "suggested_actions": "\n".join(payload["suggested_actions"]),
+        "alert_triggered": str(payload["alert_triggered"]),
+    }
+    return reading, feature, risk
 
 
 async def _handle_stream_event(message: dict[str, Any]) -> None:
@@ -166,20 +368,16 @@ async def _handle_stream_event(message: dict[str, Any]) -> None:
             "report_file": report_file,
         }
 
-    async with state.lock:
-        state.latest = payload
-        state.history.append(payload)
-        if len(state.history) > 400:
-            state.history = state.history[-400:]
-
-        if alert_payload:
-            state.alerts.append(alert_payload)
-            if len(state.alerts) > 100:
-                state.alerts = state.alerts[-100:]
-
-    await state.broadcast({"type": "telemetry", "payload": payload})
+    # Only the event loop writes these fields, so plain rebinds are safe without a lock.
+    # latest must always be rebound to a fresh dict, never mutated in place: readers
+    # such as /api/chat use the reference directly.
+    state.latest = payload
+    state.history.append(payload)
+    state.telemetry_slot = payload
     if alert_payload:
-        await state.broadcast({"type": "alert", "payload": alert_payload})
+        state.alerts.append(alert_payload)
+        state.alert_queue.append(alert_payload)
+    state.queue_rows(payload)
 
 
 async def _run_stream_processor() -> None:
@@ -188,38 +386,84 @@ async def _run_stream_processor() -> None:
     await state.stream_processor.start()
 
 
-@app.on_event("startup")
-async def on_startup() -> None:
-    """Initialize database and start real-time stream processor."""
-    logger.info("Initializing AgriGuardian AI...")
-
+def _init_database() -> None:
     db.init_sync()
     db.create_tables()
-    logger.info("Database initialized")
 
+
+async def _load_assistant() -> None:
     global assistant
-    assistant = RagAssistant(knowledge_dir=knowledge_dir)
+    try:
+        assistant = await asyncio.to_thread(RagAssistant, knowledge_dir=knowledge_dir)
+    except Exception as e:
+        logger.error("Error initializing RAG assistant: %s", e)
+        return
     logger.info("RAG assistant initialized")
 
+
+async def on_startup() -> None:
+    """
+    Initialize database and start real-time stream processor.
+    The RAG assistant (model load + indexing) loads in a worker thread while
+    the stream starts; /api/chat reports it as not initialized until then.
+    """
+    logger.info("Initializing AgriGuardian AI...")
+
+    await asyncio.to_thread(_init_database)
+    await db.init_async()
+    logger.info("Database initialized")
+
+    state.assistant_task = asyncio.create_task(_load_assistant())
+
+    # With several Uvicorn workers, one leader runs the ETL stream and publishes
+    # broadcasts to Redis; every worker relays them to its own WebSocket clients.
+    is_leader = os.getenv("STREAM_LEADER", "1").strip() == "1"
+    redis_url = os.getenv("REDIS_URL", "").strip()
+    if redis_url:
+        import redis.asyncio as redis
+
+        state.bus = redis.from_url(redis_url)
+        state.bus_task = asyncio.create_task(state.relay_bus(apply_state=not is_leader))
+        logger.info("Broadcast bus connected: %s", BROADCAST_CHANNEL)
+
+    if not is_leader:
+        state.stream_source_type = "relay"
+        logger.info("Running as broadcast relay; stream processing is handled by the leader")
+        return
+
     source_name, source = _build_stream_source()
     state.stream_source_type = source_name
     state.stream_processor = StreamProcessor(source=source, etl_pipeline=state.etl_pipeline)
     state.stream_processor.add_handler(_handle_stream_event)
     state.stream_task = asyncio.create_task(_run_stream_processor())
+    state.drain_task = asyncio.create_task(state.drain_broadcasts(), name="drain_broadcasts")
+    state.drain_task.add_done_callback(_log_task_exit)
+    state.persist_task = asyncio.create_task(state.persist_rows())
     logger.info("Real-time stream started with source: %s", source_name)
 
 
-@app.on_event("shutdown")
 async def on_shutdown() -> None:
     """Gracefully stop stream processing."""
     if state.stream_processor:
         await state.stream_processor.stop()
-    if state.stream_task and not state.stream_task.done():
-        state.stream_task.cancel()
-        try:
-            await state.stream_task
-        except asyncio.CancelledError:
-            pass
+    for task in (
+        state.stream_task,
+        state.drain_task,
+        state.persist_task,
+        state.assistant_task,
+        state.bus_task,
+    ):
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    state.etl_pipeline.close()
+    # Shielded so a cancelled teardown does not abandon the last batch mid-write
+    await asyncio.shield(state.flush_rows())
+    if state.bus is not None:
+        await state.bus.aclose()
 
 
 @app.get("/api/health")
@@ -236,12 +480,11 @@ async def health() -> dict[str, str]:
 @app.get("/api/state")
 async def get_state() -> dict[str, Any]:
     """Get current live state including latest reading, history, and alerts."""
-    async with state.lock:
-        return {
-            "latest": state.latest,
-            "history": state.history[-60:],
-            "alerts": state.alerts[-20:],
-        }
+    return {
+        "latest": state.latest,
+        "history": list(state.history)[-60:],
+        "alerts": list(state.alerts)[-20:],
+    }
 
 
 @app.get("/api/pipeline/stats")
@@ -256,32 +499,55 @@ async def chat(request: ChatRequest) -> dict[str, Any]:
     if assistant is None:
         return {"answer": "RAG assistant not initialized yet.", "sources": []}
 
-    async with state.lock:
-        live_context = dict(state.latest)
-
-    result = assistant.answer(question=request.question, live_context=live_context)
+    # state.latest is always rebound, never mutated in place, so no copy is needed
+    result = assistant.answer(question=request.question, live_context=state.latest)
     return result
 
 
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """Chat endpoint that streams the answer text as the LLM produces it."""
+    if assistant is None:
+        return StreamingResponse(iter(["RAG assistant not initialized yet."]), media_type="text/plain")
+
+    return StreamingResponse(
+        assistant.answer_stream(question=request.question, live_context=state.latest),
+        media_type="text/plain; charset=utf-8",
+    )
+
+
+async def _ping(websocket: WebSocket, interval: float = 20.0) -> None:
+    """Send a periodic server-side keepalive so idle connections survive proxies."""
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            await websocket.send_bytes(_PING_FRAME)
+    except Exception:
+        # The receive loop notices the disconnect and cleans up
+        pass
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket) -> None:
     """WebSocket endpoint for real-time updates."""
     await websocket.accept()
-    state.connections.add(websocket)
+    state.add_connection(websocket)
+    ping_task = asyncio.create_task(_ping(websocket))
     try:
-        async with state.lock:
-            if state.latest:
-                await websocket.send_json({"type": "telemetry", "payload": state.latest})
-            for item in state.alerts[-5:]:
-                await websocket.send_json({"type": "alert", "payload": item})
+        # Replay current state as one frame instead of one send per item
+        snapshot = {"type": "snapshot", "latest": state.latest, "alerts": list(state.alerts)[-5:]}
+        await websocket.send_bytes(_ENCODER.encode(snapshot))
 
-        while True:
-            await websocket.receive_text()
+        # Park until the client disconnects; incoming frames are not decoded
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
     except WebSocketDisconnect:
-        state.connections.discard(websocket)
+        pass
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
-        state.connections.discard(websocket)
+        logger.error("WebSocket error: %s", e)
+    finally:
+        ping_task.cancel()
+        state.remove_connection(websocket)
 
 
 # Mount frontend
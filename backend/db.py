@@ -2,22 +2,27 @@
 
 from __future__ import annotations
 
+import csv
+import io
 import os
-from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Generator, Iterable, Sequence
 
 from sqlalchemy import (
     Column,
     DateTime,
     Float,
     Integer,
+    LargeBinary,
     String,
     Text,
     create_engine,
     event,
+    insert,
+    text,
 )
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from datetime import datetime, timezone
 
 # Database URL from environment or default to SQLite for local development
@@ -34,13 +39,67 @@ ASYNC_DATABASE_URL = os.getenv(
 
 Base = declarative_base()
 
+# Append-only, time-indexed tables that become TimescaleDB hypertables when enabled
+_HYPERTABLES = ("sensor_readings", "processed_features")
+
+
+def _utcnow() -> datetime:
+    """Column default evaluated per row (not once at import)."""
+    return datetime.now(timezone.utc)
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Use WAL journaling with relaxed fsync for write-heavy stream ingestion."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+def _engine_options(url: str) -> dict[str, Any]:
+    """Pool settings for server databases; SQLite keeps SQLAlchemy's defaults."""
+    if "sqlite" in url:
+        return {}
+    options: dict[str, Any] = {"pool_size": 20, "max_overflow": 0, "pool_recycle": 1800}
+    if url.startswith(("postgresql://", "postgresql+psycopg2://")):
+        # Send executemany() as paged multi-row VALUES instead of one statement per row
+        options["executemany_mode"] = "values_plus_batch"
+    return options
+
+
+def reserve_ids(session: Session, table: str, count: int) -> list[int]:
+    """Draw `count` primary keys from a PostgreSQL table's serial sequence."""
+    return session.execute(
+        text("SELECT nextval(pg_get_serial_sequence(:table, 'id')) FROM generate_series(1, :count)"),
+        {"table": table, "count": count},
+    ).scalars().all()
+
+
+def copy_rows(session: Session, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+    """
+    Bulk-load rows with PostgreSQL COPY FROM STDIN inside the session's transaction
+    (psycopg2 connections only).
+    Column defaults are not applied, so callers pass every value explicitly.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+
 
 class SensorReading(Base):
     """Raw sensor data readings from ETL pipeline."""
     __tablename__ = "sensor_readings"
 
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime, default=datetime.now(timezone.utc), index=True)
+    timestamp = Column(DateTime, default=_utcnow, index=True)
     crop_type = Column(String(50), index=True)
     temperature = Column(Float)
     humidity = Column(Float)
@@ -58,7 +117,7 @@ class ProcessedFeature(Base):
     __tablename__ = "processed_features"
 
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime, default=datetime.now(timezone.utc), index=True)
+    timestamp = Column(DateTime, default=_utcnow, index=True)
     sensor_reading_id = Column(Integer, index=True)
     crop_type = Column(String(50), index=True)
     rolling_temp_avg = Column(Float)
@@ -74,7 +133,7 @@ class DiseaseRisk(Base):
     __tablename__ = "disease_risks"
 
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime, default=datetime.now(timezone.utc), index=True)
+    timestamp = Column(DateTime, default=_utcnow, index=True)
     feature_id = Column(Integer, index=True)
     crop_type = Column(String(50), index=True)
     risk_score = Column(Integer)
@@ -95,7 +154,7 @@ class RAGDocument(Base):
     filename = Column(String(255), unique=True, index=True)
     content = Column(Text)
     content_hash = Column(String(64), unique=True)
-    indexed_at = Column(DateTime, default=datetime.now(timezone.utc))
+    indexed_at = Column(DateTime, default=_utcnow)
 
 
 class RAGChunk(Base):
@@ -106,9 +165,9 @@ class RAGChunk(Base):
     document_id = Column(Integer, index=True)
     chunk_index = Column(Integer)
     text = Column(Text)
-    vector = Column(String)  # Stored as JSON string for flexibility
+    vector = Column(LargeBinary)  # int8 codes + float32 scale (see vector_rag._encode_vector)
     embedding_model = Column(String(100))
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=_utcnow)
 
 
 class DatabaseManager:
@@ -126,8 +185,11 @@ class DatabaseManager:
         self.engine = create_engine(
             self.database_url,
             connect_args={"check_same_thread": False} if "sqlite" in self.database_url else {},
-            echo=os.getenv("DB_ECHO", "false").lower() == "true"
+            echo=os.getenv("DB_ECHO", "false").lower() == "true",
+            **_engine_options(self.database_url),
         )
+        if "sqlite" in self.database_url:
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
         self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
 
         # Enable pgvector extension for PostgreSQL if needed
@@ -143,8 +205,11 @@ class DatabaseManager:
         """Initialize asynchronous database connection."""
         self.async_engine = create_async_engine(
             ASYNC_DATABASE_URL,
-            echo=os.getenv("DB_ECHO", "false").lower() == "true"
+            echo=os.getenv("DB_ECHO", "false").lower() == "true",
+            **_engine_options(ASYNC_DATABASE_URL),
         )
+        if "sqlite" in ASYNC_DATABASE_URL:
+            event.listen(self.async_engine.sync_engine, "connect", _set_sqlite_pragmas)
         self.AsyncSessionLocal = sessionmaker(
             self.async_engine, class_=AsyncSession, expire_on_commit=False
         )
@@ -154,6 +219,66 @@ class DatabaseManager:
         if self.engine is None:
             self.init_sync()
         Base.metadata.create_all(bind=self.engine)
+        if "postgresql" in self.database_url:
+            self._migrate_vector_column()
+        if "postgresql" in self.database_url and os.getenv("DB_TIMESCALE", "false").lower() == "true":
+            self._create_hypertables()
+
+    def _migrate_vector_column(self) -> None:
+        """
+        Convert rag_chunks.vector from the text type used by older versions to bytea.
+        create_all never alters existing columns; the JSON text is kept as UTF-8 bytes
+        and re-encoded by VectorRAG on the next indexing run.
+        """
+        with self.engine.begin() as conn:
+            data_type = conn.execute(
+                text(
+                    "SELECT data_type FROM information_schema.columns "
+                    "WHERE table_name = 'rag_chunks' AND column_name = 'vector'"
+                )
+            ).scalar()
+            if data_type in ("character varying", "text"):
+                conn.execute(
+                    text("ALTER TABLE rag_chunks ALTER COLUMN vector TYPE bytea USING convert_to(vector, 'UTF8')")
+                )
+
+    def _create_hypertables(self) -> None:
+        """
+        Convert the time-series tables to TimescaleDB hypertables with 1-day chunks,
+        columnar compression after 7 days and an optional retention policy.
+        """
+        retention_days = os.getenv("DB_RETENTION_DAYS", "").strip()
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb"))
+            for table in _HYPERTABLES:
+                exists = conn.execute(
+                    text("SELECT 1 FROM timescaledb_information.hypertables WHERE hypertable_name = :table"),
+                    {"table": table},
+                ).first()
+                if exists:
+                    continue
+
+                # Unique constraints on a hypertable must include the partitioning column
+                conn.execute(text(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_pkey"))
+                conn.execute(text(f"ALTER TABLE {table} ADD PRIMARY KEY (id, timestamp)"))
+                conn.execute(
+                    text(
+                        f"SELECT create_hypertable('{table}', 'timestamp', "
+                        "chunk_time_interval => INTERVAL '1 day', migrate_data => TRUE)"
+                    )
+                )
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {table} SET (timescaledb.compress, "
+                        "timescaledb.compress_segmentby = 'crop_type', "
+                        "timescaledb.compress_orderby = 'timestamp DESC')"
+                    )
+                )
+                conn.execute(text(f"SELECT add_compression_policy('{table}', INTERVAL '7 days')"))
+                if retention_days:
+                    conn.execute(
+                        text(f"SELECT add_retention_policy('{table}', INTERVAL '{int(retention_days)} days')")
+                    )
 
     async def create_tables_async(self) -> None:
         """Create all tables asynchronously."""
@@ -168,6 +293,19 @@ class DatabaseManager:
             self.init_sync()
         return self.SessionLocal()
 
+    @contextmanager
+    def session_scope(self) -> Generator[Session, None, None]:
+        """One session and transaction: commit on success, roll back on error."""
+        session = self.get_session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
     @asynccontextmanager
     async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get an asynchronous database session."""
@@ -176,6 +314,41 @@ class DatabaseManager:
         async with self.AsyncSessionLocal() as session:
             yield session
 
+    async def insert_batch(
+        self,
+        readings: list[dict[str, Any]],
+        features: list[dict[str, Any]],
+        risks: list[dict[str, Any]],
+    ) -> None:
+        """
+        Bulk-insert aligned sensor readings, features and risk rows in one transaction.
+        Foreign keys (sensor_reading_id, feature_id) are filled in from the inserted ids.
+        """
+        if not readings:
+            return
+
+        async with self.get_async_session() as session:
+            async with session.begin():
+                reading_ids = (
+                    await session.scalars(
+                        insert(SensorReading).returning(SensorReading.id, sort_by_parameter_order=True),
+                        readings,
+                    )
+                ).all()
+                for feature, reading_id in zip(features, reading_ids):
+                    feature["sensor_reading_id"] = reading_id
+
+                feature_ids = (
+                    await session.scalars(
+                        insert(ProcessedFeature).returning(ProcessedFeature.id, sort_by_parameter_order=True),
+                        features,
+                    )
+                ).all()
+                for risk, feature_id in zip(risks, feature_ids):
+                    risk["feature_id"] = feature_id
+
+                await session.execute(insert(DiseaseRisk), risks)
+
     def close(self) -> None:
         """Close database connections."""
         if self.engine:
@@ -2,27 +2,169 @@
 
 from __future__ import annotations
 
-from collections import deque
 from datetime import datetime, timezone
 import logging
+import operator
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from statistics import mean
 from typing import Any
 
+import msgspec
+import numpy as np
+from sqlalchemy import func, select
+
 try:
     import pathway as pw  # type: ignore
 except Exception:
     pw = None  # type: ignore
 
-from .db import DiseaseRisk, ProcessedFeature, SensorReading, db
+try:
+    from ciso8601 import parse_datetime as _parse_iso  # type: ignore
+except Exception:
+    _parse_iso = datetime.fromisoformat
+
+try:
+    from numba import njit  # type: ignore
+    _JIT = True
+except Exception:
+    _JIT = False
+
+    def njit(*args: Any, **kwargs: Any) -> Any:  # type: ignore
+        """Fallback that leaves kernels as plain Python when Numba is unavailable."""
+        def decorator(func: Any) -> Any:
+            return func
+        return decorator
+
+from .db import DiseaseRisk, ProcessedFeature, SensorReading, copy_rows, db, reserve_ids
 
 logger = logging.getLogger(__name__)
 
+# Numeric sensor fields, in the column order used by the vectorized batch path
+_FLOAT_COLS = (
+    "temperature",
+    "humidity",
+    "rain_forecast",
+    "soil_moisture",
+    "wind_speed",
+    "leaf_wetness",
+    "soil_temperature",
+    "soil_ph",
+    "solar_radiation",
+)
+_get_floats = operator.itemgetter(*_FLOAT_COLS)
+
+
+# get_statistics results are reused for this long, so status polling stays off the database
+_STATS_TTL_SECONDS = 5.0
+
+# Indexed by the weather code returned from _compute_features
+_WEATHER_CONDITIONS = ("Stable", "Wet-Warm", "Heat-Dry")
+_WEATHER_LABELS = np.array(_WEATHER_CONDITIONS)
+
+
+@njit(cache=True, nogil=True)
+def _compute_features(
+    temperature,
+    humidity,
+    rain_forecast,
+    soil_moisture,
+    leaf_wetness,
+    solar_radiation,
+    temp_buf,
+    hum_buf,
+    soil_buf,
+    leaf_buf,
+    sums,
+    head,
+    count,
+):
+    """
+    Numeric core of per-event feature engineering.
+    Writes the readings into the ring buffers at `head`, updates the running sums
+    in place and returns the features together with the advanced head and count.
+    """
+    window_size = temp_buf.shape[0]
+    if count == window_size:
+        sums[0] -= temp_buf[head]
+        sums[1] -= hum_buf[head]
+        sums[2] -= soil_buf[head]
+        sums[3] -= leaf_buf[head]
+    else:
+        count += 1
+
+    temp_buf[head] = temperature
+    hum_buf[head] = humidity
+    soil_buf[head] = soil_moisture
+    leaf_buf[head] = leaf_wetness
+    sums[0] += temperature
+    sums[1] += humidity
+    sums[2] += soil_moisture
+    sums[3] += leaf_wetness
+    head = (head + 1) % window_size
+
+    rolling_temp_avg = sums[0] / count
+    rolling_humidity_avg = sums[1] / count
+    rolling_soil_avg = sums[2] / count
+    rolling_leaf_wetness_avg = sums[3] / count
+
+    humidity_alert = (humidity > 80) | (rolling_humidity_avg > 78)
+
+    # Weather condition classification as a branch-free code into _WEATHER_CONDITIONS;
+    # wet-warm (temperature <= 30) and heat-dry (temperature > 32) never overlap
+    wet_warm = (
+        humidity_alert
+        & (leaf_wetness > 70)
+        & (rain_forecast > 0.6)
+        & (temperature >= 20)
+        & (temperature <= 30)
+    )
+    heat_dry = (temperature > 32) & (humidity < 45) & (solar_radiation > 650)
+    weather_code = int(wet_warm) + 2 * int(heat_dry)
+
+    # Anomaly scoring
+    anomaly_score = (
+        abs(temperature - rolling_temp_avg) / 10
+        + abs(humidity - rolling_humidity_avg) / 20
+        + abs(soil_moisture - rolling_soil_avg) / 20
+        + abs(leaf_wetness - rolling_leaf_wetness_avg) / 20
+    )
+
+    return (
+        rolling_temp_avg,
+        rolling_humidity_avg,
+        rolling_leaf_wetness_avg,
+        humidity_alert,
+        weather_code,
+        anomaly_score,
+        head,
+        count,
+    )
+
+
+def parse_event_timestamp(value: Any) -> datetime:
+    """
+    Parse an event timestamp, falling back to the current UTC time.
+    A malformed string is logged and replaced rather than raised, so one bad
+    event cannot roll back the batch it is persisted with.
+    """
+    if isinstance(value, str):
+        # ciso8601 (C) and fromisoformat on Python 3.11+ both accept a trailing "Z"
+        try:
+            return _parse_iso(value)
+        except ValueError:
+            logger.warning("Malformed event timestamp %r; using current time", value)
+    if isinstance(value, datetime):
+        return value
+    return datetime.now(timezone.utc)
 
-@dataclass
-class SensorEvent:
-    """Raw sensor event schema."""
-    timestamp: str
+
+class SensorEvent(msgspec.Struct, kw_only=True):
+    """
+    Raw sensor event schema, decoded and validated at ingest (fixed fields, no
+    per-instance dict). Unknown fields are ignored; a missing timestamp means "now".
+    """
+    timestamp: str | None = None
     crop_type: str
     temperature: float
     humidity: float
@@ -35,9 +177,9 @@ class SensorEvent:
     solar_radiation: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProcessedReading:
-    """Processed features from streaming pipeline."""
+    """Processed features from streaming pipeline (slotted, immutable)."""
     temperature: float
     humidity: float
     rain_forecast: float
@@ -55,6 +197,25 @@ class ProcessedReading:
     weather_condition: str
     anomaly_score: float
 
+    def to_dict(self) -> dict[str, Any]:
+        """Shallow field dict; slotted instances have no __dict__."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class _RollingWindows:
+    """
+    Ring buffers (temperature, humidity, soil moisture, leaf wetness) with running
+    sums, so rolling means are O(1) per event regardless of window size.
+    """
+
+    __slots__ = ("buffers", "sums", "head", "count")
+
+    def __init__(self, window_size: int):
+        self.buffers = np.zeros((4, window_size), dtype=np.float64)
+        self.sums = np.zeros(4, dtype=np.float64)
+        self.head = 0
+        self.count = 0
+
 
 class PathwayETLPipeline:
     """
@@ -62,15 +223,25 @@ class PathwayETLPipeline:
     with rolling window aggregations, feature engineering, and persistence.
     """
 
-    def __init__(self, window_size: int = 15, db_manager=None):
+    def __init__(self, window_size: int = 15, db_manager=None, persist: bool = True, workers: int = 1):
         self.window_size = window_size
         self.db_manager = db_manager or db
-        self.temperature_window: deque[float] = deque(maxlen=window_size)
-        self.humidity_window: deque[float] = deque(maxlen=window_size)
-        self.soil_window: deque[float] = deque(maxlen=window_size)
-        self.leaf_wetness_window: deque[float] = deque(maxlen=window_size)
+        # Callers that batch their own writes (e.g. the API's async writer) pass persist=False
+        self.persist = persist
+        self._windows = _RollingWindows(window_size)
+        # With workers > 1, process_batch shards events by crop_type onto a thread pool and
+        # keeps separate rolling windows per crop so each shard stays sequential
+        self._pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        self._crop_windows: dict[str, _RollingWindows] = {}
+        self._stats_cache: tuple[float, dict[str, Any]] | None = None
         self._init_pathway()
 
+    def close(self) -> None:
+        """Shut down the worker pool; the pipeline must not process events afterwards."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
     def _init_pathway(self):
         """Initialize Pathway connector and schema."""
         if pw is None or not hasattr(pw, "Schema") or not hasattr(pw, "Column"):
@@ -95,31 +266,197 @@ class PathwayETLPipeline:
 
     def process_batch(self, events: list[dict[str, Any]]) -> list[ProcessedReading]:
         """Process a batch of sensor events through the ETL pipeline."""
+        return [reading for _, reading in self._process_per_event(events)]
+
+    def _process_per_event(self, events: list[dict[str, Any]]) -> list[tuple[dict[str, Any], ProcessedReading]]:
+        """Run each event through the _compute_features kernel, sharded by crop when pooled."""
+        if self._pool is not None:
+            results = self._process_sharded(events)
+        else:
+            results = [self._try_process_event(event, self._windows) for event in events]
+
         processed = []
-        
+        valid_events = []
+        for event, reading in zip(events, results):
+            if reading is not None:
+                processed.append(reading)
+                valid_events.append(event)
+
+        if self.persist and processed:
+            self._persist_batch(valid_events, processed)
+
+        return list(zip(valid_events, processed))
+
+    def _process_sharded(self, events: list[dict[str, Any]]) -> list[ProcessedReading | None]:
+        """Run per-crop shards on the thread pool; results keep the input order."""
+        shards: dict[str, list[int]] = {}
+        for index, event in enumerate(events):
+            shards.setdefault(str(event.get("crop_type")), []).append(index)
+
+        results: list[ProcessedReading | None] = [None] * len(events)
+
+        def run_shard(windows: _RollingWindows, indices: list[int]) -> None:
+            for index in indices:
+                results[index] = self._try_process_event(events[index], windows)
+
+        futures = []
+        for crop_type, indices in shards.items():
+            windows = self._crop_windows.get(crop_type)
+            if windows is None:
+                windows = self._crop_windows[crop_type] = _RollingWindows(self.window_size)
+            futures.append(self._pool.submit(run_shard, windows, indices))
+        for future in futures:
+            future.result()
+        return results
+
+    def _try_process_event(self, event: dict[str, Any], windows: _RollingWindows) -> ProcessedReading | None:
+        """Process one event, logging and returning None if it is malformed."""
+        try:
+            return self._process_single_event(event, windows)
+        except Exception as e:
+            logger.error("Error processing event: %s", e, extra={"event_id": event.get("timestamp")})
+            logger.debug("Rejected event: %r", event)
+            return None
+
+    def process_batch_vectorized(self, events: list[dict[str, Any]]) -> list[ProcessedReading]:
+        """
+        Process a batch of sensor events with column-wise NumPy operations.
+        Produces the same features as process_batch and continues the same rolling windows.
+        """
+        return [reading for _, reading in self._process_columns(events)]
+
+    def process_events(self, events: list[dict[str, Any]]) -> list[tuple[dict[str, Any], ProcessedReading]]:
+        """
+        Batch processing that pairs each accepted event with its reading. Uses the compiled
+        per-event kernel when Numba is installed or a worker pool is configured, and the
+        NumPy column path otherwise.
+        """
+        if _JIT or self._pool is not None:
+            return self._process_per_event(events)
+        return self._process_columns(events)
+
+    def _process_columns(self, events: list[dict[str, Any]]) -> list[tuple[dict[str, Any], ProcessedReading]]:
+        """Vectorized batch processing with column-wise NumPy operations."""
+        rows: list[tuple[float, ...]] = []
+        valid_events: list[dict[str, Any]] = []
+        crop_types: list[str] = []
         for event in events:
             try:
-                reading = self._process_single_event(event)
-                sensor_record = self._persist_sensor_reading(event)
-                self._persist_processed_feature(reading, sensor_record.id if sensor_record else None)
-                processed.append(reading)
+                row = tuple(map(float, _get_floats(event)))
+                crop_type = str(event["crop_type"])
             except Exception as e:
-                logger.error(f"Error processing event {event}: {e}")
+                logger.error("Error processing event: %s", e, extra={"event_id": event.get("timestamp")})
+                logger.debug("Rejected event: %r", event)
                 continue
+            # Appended together, so a rejected event never leaves the columns misaligned
+            rows.append(row)
+            crop_types.append(crop_type)
+            valid_events.append(event)
+
+        if not rows:
+            return []
+
+        (
+            temperature,
+            humidity,
+            rain_forecast,
+            soil_moisture,
+            wind_speed,
+            leaf_wetness,
+            soil_temperature,
+            soil_ph,
+            solar_radiation,
+        ) = np.asarray(rows, dtype=np.float64).T
+
+        windows = self._windows
+        rolling_temp = self._rolling_mean(windows.buffers[0], temperature)
+        rolling_hum = self._rolling_mean(windows.buffers[1], humidity)
+        rolling_soil = self._rolling_mean(windows.buffers[2], soil_moisture)
+        rolling_leaf = self._rolling_mean(windows.buffers[3], leaf_wetness)
+        windows.count = min(self.window_size, windows.count + len(rows))
+        windows.head = windows.count % self.window_size
+        windows.sums[:] = windows.buffers[:, : windows.count].sum(axis=1)
+
+        humidity_alert = (humidity > 80) | (rolling_hum > 78)
+        wet_warm = (
+            humidity_alert
+            & (leaf_wetness > 70)
+            & (rain_forecast > 0.6)
+            & (temperature >= 20)
+            & (temperature <= 30)
+        )
+        heat_dry = (temperature > 32) & (humidity < 45) & (solar_radiation > 650)
+        weather_code = wet_warm.astype(np.int8) + 2 * heat_dry.astype(np.int8)
+        weather_condition = _WEATHER_LABELS[weather_code]
+
+        anomaly_score = (
+            np.abs(temperature - rolling_temp) / 10
+            + np.abs(humidity - rolling_hum) / 20
+            + np.abs(soil_moisture - rolling_soil) / 20
+            + np.abs(leaf_wetness - rolling_leaf) / 20
+        )
+
+        processed = [
+            ProcessedReading(*row)
+            for row in zip(
+                temperature.tolist(),
+                humidity.tolist(),
+                rain_forecast.tolist(),
+                soil_moisture.tolist(),
+                wind_speed.tolist(),
+                leaf_wetness.tolist(),
+                soil_temperature.tolist(),
+                soil_ph.tolist(),
+                solar_radiation.tolist(),
+                crop_types,
+                rolling_temp.tolist(),
+                rolling_hum.tolist(),
+                rolling_leaf.tolist(),
+                humidity_alert.tolist(),
+                weather_condition.tolist(),
+                anomaly_score.tolist(),
+            )
+        ]
+
+        if self.persist:
+            self._persist_batch(valid_events, processed)
+
+        return list(zip(valid_events, processed))
+
+    def _rolling_mean(self, buffer: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """
+        Rolling mean of `values` seeded with a ring buffer's current window.
+        The newest window is written back oldest-first; the caller resets head/count/sums.
+        """
+        windows = self._windows
+        if windows.count < self.window_size:
+            history = buffer[: windows.count]
+        else:
+            history = np.concatenate((buffer[windows.head:], buffer[: windows.head]))
+        series = np.concatenate((history, values))
+        cumulative = np.concatenate(([0.0], np.cumsum(series)))
 
-        return processed
+        end = np.arange(len(history), len(series)) + 1
+        start = np.maximum(end - self.window_size, 0)
+        tail = series[-self.window_size:]
+        buffer[: len(tail)] = tail
+        return (cumulative[end] - cumulative[start]) / (end - start)
 
     def process_stream(self, data_stream: list[dict]) -> pw.Table:
         """
         Create a Pathway streaming pipeline from a data stream.
         Useful for integration with message queues (Kafka, RabbitMQ).
         """
-        if pw is None or not hasattr(pw, "from_pandas"):
+        if self.sensor_schema is None:
             raise RuntimeError("Pathway runtime is unavailable on this environment.")
 
-        # Convert to list of dicts to Pathway table
-        table = pw.from_pandas(
-            self._convert_to_dataframe(data_stream)
+        # Feed rows straight into Pathway in schema column order (no pandas round trip)
+        table = pw.debug.table_from_rows(
+            schema=self.sensor_schema,
+            rows=[
+                (event["timestamp"], event["crop_type"], *(float(event[col]) for col in _FLOAT_COLS))
+                for event in data_stream
+            ],
         ) if data_stream else None
 
         if table is None:
@@ -144,45 +481,48 @@ class PathwayETLPipeline:
 
         return enriched
 
-    def _process_single_event(self, payload: dict[str, Any]) -> ProcessedReading:
+    def _process_single_event(
+        self, payload: dict[str, Any], windows: _RollingWindows | None = None
+    ) -> ProcessedReading:
         """Process a single sensor event through feature engineering."""
-        temperature = float(payload["temperature"])
-        humidity = float(payload["humidity"])
-        rain_forecast = float(payload["rain_forecast"])
-        soil_moisture = float(payload["soil_moisture"])
-        wind_speed = float(payload["wind_speed"])
-        leaf_wetness = float(payload["leaf_wetness"])
-        soil_temperature = float(payload["soil_temperature"])
-        soil_ph = float(payload["soil_ph"])
-        solar_radiation = float(payload["solar_radiation"])
+        if windows is None:
+            windows = self._windows
+        (
+            temperature,
+            humidity,
+            rain_forecast,
+            soil_moisture,
+            wind_speed,
+            leaf_wetness,
+            soil_temperature,
+            soil_ph,
+            solar_radiation,
+        ) = map(float, _get_floats(payload))
         crop_type = str(payload["crop_type"])
 
-        self.temperature_window.append(temperature)
-        self.humidity_window.append(humidity)
-        self.soil_window.append(soil_moisture)
-        self.leaf_wetness_window.append(leaf_wetness)
-
-        rolling_temp_avg = mean(self.temperature_window)
-        rolling_humidity_avg = mean(self.humidity_window)
-        rolling_soil_avg = mean(self.soil_window)
-        rolling_leaf_wetness_avg = mean(self.leaf_wetness_window)
-
-        humidity_alert = humidity > 80 or rolling_humidity_avg > 78
-
-        # Weather condition classification
-        if humidity_alert and leaf_wetness > 70 and rain_forecast > 0.6 and 20 <= temperature <= 30:
-            weather_condition = "Wet-Warm"
-        elif temperature > 32 and humidity < 45 and solar_radiation > 650:
-            weather_condition = "Heat-Dry"
-        else:
-            weather_condition = "Stable"
-
-        # Anomaly scoring
-        anomaly_score = (
-            abs(temperature - rolling_temp_avg) / 10
-            + abs(humidity - rolling_humidity_avg) / 20
-            + abs(soil_moisture - rolling_soil_avg) / 20
-            + abs(leaf_wetness - rolling_leaf_wetness_avg) / 20
+        (
+            rolling_temp_avg,
+            rolling_humidity_avg,
+            rolling_leaf_wetness_avg,
+            humidity_alert,
+            weather_code,
+            anomaly_score,
+            windows.head,
+            windows.count,
+        ) = _compute_features(
+            temperature,
+            humidity,
+            rain_forecast,
+            soil_moisture,
+            leaf_wetness,
+            solar_radiation,
+            windows.buffers[0],
+            windows.buffers[1],
+            windows.buffers[2],
+            windows.buffers[3],
+            windows.sums,
+            windows.head,
+            windows.count,
         )
 
         return ProcessedReading(
@@ -196,89 +536,132 @@ class PathwayETLPipeline:
             soil_ph=soil_ph,
             solar_radiation=solar_radiation,
             crop_type=crop_type,
-            rolling_temp_avg=round(rolling_temp_avg, 2),
-            rolling_humidity_avg=round(rolling_humidity_avg, 2),
-            rolling_leaf_wetness_avg=round(rolling_leaf_wetness_avg, 2),
-            humidity_alert=humidity_alert,
-            weather_condition=weather_condition,
-            anomaly_score=round(anomaly_score, 3),
+            rolling_temp_avg=float(rolling_temp_avg),
+            rolling_humidity_avg=float(rolling_humidity_avg),
+            rolling_leaf_wetness_avg=float(rolling_leaf_wetness_avg),
+            humidity_alert=bool(humidity_alert),
+            weather_condition=_WEATHER_CONDITIONS[weather_code],
+            anomaly_score=float(anomaly_score),
         )
 
-    def _persist_sensor_reading(self, event: dict[str, Any]) -> SensorReading | None:
-        """Persist raw sensor reading to database."""
-        session = self.db_manager.get_session()
-        try:
-            event_timestamp = event.get("timestamp")
-            parsed_timestamp: datetime | None = None
-            if isinstance(event_timestamp, str):
-                parsed_timestamp = datetime.fromisoformat(event_timestamp.replace("Z", "+00:00"))
-            elif isinstance(event_timestamp, datetime):
-                parsed_timestamp = event_timestamp
-
-            reading = SensorReading(
-                timestamp=parsed_timestamp or datetime.now(timezone.utc),
-                crop_type=event.get("crop_type"),
-                temperature=float(event.get("temperature", 0)),
-                humidity=float(event.get("humidity", 0)),
-                rain_forecast=float(event.get("rain_forecast", 0)),
-                soil_moisture=float(event.get("soil_moisture", 0)),
-                wind_speed=float(event.get("wind_speed", 0)),
-                leaf_wetness=float(event.get("leaf_wetness", 0)),
-                soil_temperature=float(event.get("soil_temperature", 0)),
-                soil_ph=float(event.get("soil_ph", 0)),
-                solar_radiation=float(event.get("solar_radiation", 0)),
-            )
-            session.add(reading)
-            session.commit()
-            session.refresh(reading)
-            return reading
-        except Exception as e:
-            logger.error(f"Error persisting sensor reading: {e}")
-            session.rollback()
-            return None
-        finally:
-            session.close()
-
-    def _persist_processed_feature(self, processed: ProcessedReading, sensor_reading_id: int | None) -> None:
-        """Persist processed features to database."""
-        session = self.db_manager.get_session()
+    def _persist_batch(self, events: list[dict[str, Any]], processed: list[ProcessedReading]) -> None:
+        """Persist raw readings and their processed features in a single transaction."""
         try:
-            feature = ProcessedFeature(
-                sensor_reading_id=sensor_reading_id,
-                crop_type=processed.crop_type,
-                rolling_temp_avg=processed.rolling_temp_avg,
-                rolling_humidity_avg=processed.rolling_humidity_avg,
-                rolling_leaf_wetness_avg=processed.rolling_leaf_wetness_avg,
-                humidity_alert=str(processed.humidity_alert),
-                weather_condition=processed.weather_condition,
-                anomaly_score=processed.anomaly_score,
-            )
-            session.add(feature)
-            session.commit()
+            with self.db_manager.session_scope() as session:
+                # copy_rows drives psycopg2's copy_expert; other PostgreSQL drivers use the ORM path
+                if session.get_bind().dialect.driver == "psycopg2":
+                    self._copy_batch(session, events, processed)
+                    return
+
+                sensor_rows = [
+                    SensorReading(
+                        timestamp=parse_event_timestamp(event.get("timestamp")),
+                        crop_type=event.get("crop_type"),
+                        temperature=float(event.get("temperature", 0)),
+                        humidity=float(event.get("humidity", 0)),
+                        rain_forecast=float(event.get("rain_forecast", 0)),
+                        soil_moisture=float(event.get("soil_moisture", 0)),
+                        wind_speed=float(event.get("wind_speed", 0)),
+                        leaf_wetness=float(event.get("leaf_wetness", 0)),
+                        soil_temperature=float(event.get("soil_temperature", 0)),
+                        soil_ph=float(event.get("soil_ph", 0)),
+                        solar_radiation=float(event.get("solar_radiation", 0)),
+                    )
+                    for event in events
+                ]
+                session.add_all(sensor_rows)
+                # Flush assigns primary keys so features can reference their readings
+                session.flush()
+
+                session.add_all(
+                    [
+                        ProcessedFeature(
+                            sensor_reading_id=sensor_row.id,
+                            crop_type=reading.crop_type,
+                            rolling_temp_avg=reading.rolling_temp_avg,
+                            rolling_humidity_avg=reading.rolling_humidity_avg,
+                            rolling_leaf_wetness_avg=reading.rolling_leaf_wetness_avg,
+                            humidity_alert=str(reading.humidity_alert),
+                            weather_condition=reading.weather_condition,
+                            anomaly_score=reading.anomaly_score,
+                        )
+                        for sensor_row, reading in zip(sensor_rows, processed)
+                    ]
+                )
         except Exception as e:
-            logger.error(f"Error persisting processed feature: {e}")
-            session.rollback()
-        finally:
-            session.close()
+            logger.error("Error persisting batch of %d events: %s", len(events), e)
+
+    def _copy_batch(self, session, events: list[dict[str, Any]], processed: list[ProcessedReading]) -> None:
+        """PostgreSQL fast path: COPY both tables, with reading ids reserved up front."""
+        reading_ids = reserve_ids(session, SensorReading.__tablename__, len(events))
+        copy_rows(
+            session,
+            SensorReading.__tablename__,
+            ("id", "timestamp", "crop_type", *_FLOAT_COLS),
+            (
+                (
+                    reading_id,
+                    parse_event_timestamp(event.get("timestamp")),
+                    event.get("crop_type"),
+                    *(float(event.get(col, 0)) for col in _FLOAT_COLS),
+                )
+                for reading_id, event in zip(reading_ids, events)
+            ),
+        )
 
-    def _convert_to_dataframe(self, data_stream: list[dict]):
-        """Convert data stream to pandas DataFrame for Pathway processing."""
-        import pandas as pd
-        return pd.DataFrame(data_stream)
+        now = datetime.now(timezone.utc)
+        copy_rows(
+            session,
+            ProcessedFeature.__tablename__,
+            (
+                "timestamp",
+                "sensor_reading_id",
+                "crop_type",
+                "rolling_temp_avg",
+                "rolling_humidity_avg",
+                "rolling_leaf_wetness_avg",
+                "humidity_alert",
+                "weather_condition",
+                "anomaly_score",
+            ),
+            (
+                (
+                    now,
+                    reading_id,
+                    reading.crop_type,
+                    reading.rolling_temp_avg,
+                    reading.rolling_humidity_avg,
+                    reading.rolling_leaf_wetness_avg,
+                    str(reading.humidity_alert),
+                    reading.weather_condition,
+                    reading.anomaly_score,
+                )
+                for reading_id, reading in zip(reading_ids, processed)
+            ),
+        )
 
     def get_statistics(self) -> dict[str, Any]:
-        """Get ETL pipeline statistics."""
-        session = self.db_manager.get_session()
-        try:
-            sensor_count = session.query(SensorReading).count()
-            feature_count = session.query(ProcessedFeature).count()
-            risk_count = session.query(DiseaseRisk).count()
-
-            return {
+        """Get ETL pipeline statistics (row counts cached for a few seconds)."""
+        if self._stats_cache is not None:
+            cached_at, stats = self._stats_cache
+            if time.monotonic() - cached_at < _STATS_TTL_SECONDS:
+                return stats
+
+        with self.db_manager.session_scope() as session:
+            # One round trip for all three counts
+            sensor_count, feature_count, risk_count = session.execute(
+                select(
+                    select(func.count()).select_from(SensorReading).scalar_subquery(),
+                    select(func.count()).select_from(ProcessedFeature).scalar_subquery(),
+                    select(func.count()).select_from(DiseaseRisk).scalar_subquery(),
+                )
+            ).one()
+
+            stats = {
                 "sensor_readings": sensor_count,
                 "processed_features": feature_count,
                 "risk_assessments": risk_count,
                 "pipeline_status": "active"
             }
-        finally:
-            session.close()
+        self._stats_cache = (time.monotonic(), stats)
+        return stats
@@ -84,11 +84,11 @@ def example_load_from_csv():
     # Convert to list of dicts
     events = df.to_dict('records')
 
-    # Process
-    results = pipeline.process_batch(events)
+    # Process (column-wise, since the whole file is available up front)
+    results = pipeline.process_batch_vectorized(events)
 
     # Save results to CSV
-    output_df = pd.DataFrame([r.__dict__ for r in results])
+    output_df = pd.DataFrame([r.to_dict() for r in results])
     output_df.to_csv("processed_features.csv", index=False)
 
     print(f"Processed {len(results)} events. Results saved to processed_features.csv")
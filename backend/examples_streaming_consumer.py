@@ -30,14 +30,20 @@ async def main_kafka_consumer():
     kafka_source = KafkaStreamSource(
         bootstrap_servers="localhost:9092",
         topic="sensor-data",
-        group_id="agriguardian-workers"
+        group_id="agriguardian-workers",
+        consumer_config={
+            "fetch_min_bytes": 1 << 20,
+            "fetch_max_wait_ms": 50,
+            "max_poll_records": 1000,
+        },
     )
 
     # Create stream processor
     processor = StreamProcessor(
         source=kafka_source,
         etl_pipeline=etl_pipeline,
-        batch_size=50
+        batch_size=1000,
+        batch_timeout_ms=50,
     )
 
     # Add handler
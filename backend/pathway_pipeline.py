@@ -2,12 +2,9 @@
 
 from __future__ import annotations
 
-from collections import deque
-from dataclasses import dataclass
-from statistics import mean
 from typing import Any
 
-# Import from new ETL pipeline
+# Single implementation lives in the ETL pipeline; re-exported for legacy imports
 from .etl_pipeline import ProcessedReading, PathwayETLPipeline
 
 
@@ -19,11 +16,8 @@ class StreamingFeaturePipeline:
 
     def __init__(self, window_size: int = 12) -> None:
         self.window_size = window_size
+        # Rolling windows live in the wrapped pipeline; this class keeps no state of its own
         self.etl_pipeline = PathwayETLPipeline(window_size=window_size)
-        self.temperature_window: deque[float] = deque(maxlen=window_size)
-        self.humidity_window: deque[float] = deque(maxlen=window_size)
-        self.soil_window: deque[float] = deque(maxlen=window_size)
-        self.leaf_wetness_window: deque[float] = deque(maxlen=window_size)
 
     def process(self, payload: dict[str, Any]) -> ProcessedReading:
         """Process event through the ETL pipeline."""
@@ -2,11 +2,47 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 from .vector_rag import VectorRAG
 
+# One indexed VectorRAG per knowledge directory, with the directory state it was indexed at
+_RAG_CACHE: dict[Path, tuple[tuple[tuple[str, float, int], ...], VectorRAG]] = {}
+_RAG_CACHE_LOCK = threading.Lock()
+# Minimum seconds between knowledge directory stat sweeps on the query path
+_REFRESH_INTERVAL_SECONDS = 60.0
+
+
+def _knowledge_state(knowledge_dir: Path) -> tuple[tuple[str, float, int], ...]:
+    """
+    (name, mtime, size) of every knowledge base document, so edits, additions,
+    deletions and renames all change the result.
+    """
+    entries = []
+    for path in knowledge_dir.glob("*.md"):
+        stat = path.stat()
+        entries.append((path.name, stat.st_mtime, stat.st_size))
+    return tuple(sorted(entries))
+
+
+def _get_vector_rag(knowledge_dir: Path) -> VectorRAG:
+    """Return the cached VectorRAG for a directory, re-indexing only when documents changed."""
+    key = knowledge_dir.resolve()
+    with _RAG_CACHE_LOCK:
+        knowledge_state = _knowledge_state(key)
+        cached = _RAG_CACHE.get(key)
+        if cached is not None and cached[0] == knowledge_state:
+            return cached[1]
+
+        vector_rag = cached[1] if cached is not None else VectorRAG(knowledge_dir=knowledge_dir)
+        indexed = vector_rag.load_and_index_documents()
+        print(f"Indexed {indexed} chunks from knowledge base")
+        _RAG_CACHE[key] = (knowledge_state, vector_rag)
+        return vector_rag
+
 
 class RagAssistant:
     """
@@ -17,16 +53,36 @@ class RagAssistant:
     def __init__(self, knowledge_dir: Path) -> None:
         """Initialize RAG with knowledge directory."""
         self.knowledge_dir = knowledge_dir
-        self.vector_rag = VectorRAG(knowledge_dir=knowledge_dir)
-        
-        # Load and index documents on initialization
-        indexed = self.vector_rag.load_and_index_documents()
-        print(f"Indexed {indexed} chunks from knowledge base")
+        # Shared per directory, so repeated construction neither reloads the model nor re-embeds
+        self.vector_rag = _get_vector_rag(knowledge_dir)
+        self._checked_at = time.monotonic()
+
+    def _refresh(self) -> VectorRAG:
+        """
+        Pick up edited or added documents, stat-ing the directory at most once a minute.
+        The check and any re-indexing run on a background thread, so callers on the event
+        loop never block on them and keep querying the current index meanwhile.
+        """
+        now = time.monotonic()
+        if now - self._checked_at >= _REFRESH_INTERVAL_SECONDS:
+            self._checked_at = now
+            threading.Thread(target=self._reindex, name="rag-refresh", daemon=True).start()
+        return self.vector_rag
+
+    def _reindex(self) -> None:
+        try:
+            self.vector_rag = _get_vector_rag(self.knowledge_dir)
+        except Exception as e:
+            print(f"Error refreshing knowledge base: {e}")
 
     def retrieve(self, question: str, top_k: int = 3):
         """Retrieve relevant chunks using vector similarity."""
-        return self.vector_rag.retrieve(question, top_k=top_k)
+        return self._refresh().retrieve(question, top_k=top_k)
 
     def answer(self, question: str, live_context: dict[str, Any]) -> dict[str, Any]:
         """Generate answer using RAG with live context."""
-        return self.vector_rag.answer(question, live_context)
+        return self._refresh().answer(question, live_context)
+
+    def answer_stream(self, question: str, live_context: dict[str, Any]) -> AsyncIterator[str]:
+        """Stream the answer text as it is generated."""
+        return self._refresh().answer_stream(question, live_context)
@@ -1,10 +1,175 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
-
-
-@dataclass
+from typing import Any, Iterator, NamedTuple
+
+import numpy as np
+
+try:
+    import cupy as cp  # type: ignore
+except Exception:
+    cp = None  # type: ignore
+
+# Scoring rules in evaluation order: points awarded and the reason reported when a rule fires
+_RULE_POINTS = (25, 20, 20, 12, 10, 10, 8, 6, 6, 10)
+_RULE_REASONS = (
+    "Humidity is above 80%, creating fungal-friendly conditions.",
+    "Temperature is in the 20–30°C fungal growth range.",
+    "Rain is forecasted, increasing leaf wetness duration.",
+    "Leaf wetness is elevated, increasing fungal germination likelihood.",
+    "Soil moisture is high, supporting pathogen persistence.",
+    "Low wind speed can reduce canopy drying.",
+    "Soil temperature supports disease development dynamics.",
+    "Soil pH is outside the preferred range, increasing plant stress.",
+    "Low solar radiation with high humidity may prolong canopy wetness.",
+    "Recent sensor pattern deviates from rolling baseline.",
+)
+_LEVEL_HIGH, _LEVEL_MED = 75, 45
+_LEVEL_NAMES = ("LOW", "MEDIUM", "HIGH")
+# Below this many events the host<->GPU copies cost more than the CPU path saves
+_GPU_MIN_BATCH = 1_000_000
+_CROP_ADJUSTMENT = {
+    "rice": 8,
+    "tomato": 8,
+    "potato": 6,
+    "wheat": 4,
+    "maize": 3,
+    "cotton": 4,
+}
+_LEVEL_ACTIONS = {
+    "HIGH": (
+        "Increase field scouting frequency to twice daily.",
+        "Improve air circulation and avoid overhead irrigation.",
+        "Prepare targeted fungicide plan based on local agronomy guidance.",
+    ),
+    "MEDIUM": (
+        "Monitor humidity and rainfall windows closely.",
+        "Inspect lower canopy and shaded zones for early signs.",
+        "Optimize irrigation timing for morning-only watering.",
+    ),
+    "LOW": (
+        "Continue routine monitoring and maintain hygiene practices.",
+        "Keep drainage and ventilation in good condition.",
+    ),
+}
+# Crop-specific fungal disease profiles: (disease, base confidence, suggestions)
+_FUNGAL_PROFILES: dict[str, tuple[str, int, tuple[str, ...]]] = {
+    "tomato": (
+        "Early blight (Alternaria) risk",
+        72,
+        (
+            "Remove infected lower leaves and sanitize tools after handling plants.",
+            "Use preventive fungicide strategy with active ingredient rotation.",
+            "Avoid overhead irrigation in late afternoon and evening.",
+        ),
+    ),
+    "potato": (
+        "Late blight risk",
+        76,
+        (
+            "Start preventive blight spray schedule based on local advisory guidance.",
+            "Improve field drainage and avoid dense canopy humidity pockets.",
+            "Scout high-risk zones twice daily after rainfall windows.",
+        ),
+    ),
+    "rice": (
+        "Rice blast risk",
+        74,
+        (
+            "Avoid excess nitrogen applications during high-risk humid windows.",
+            "Maintain optimal spacing and water management to limit prolonged wetness.",
+            "Apply targeted fungicide only when threshold is confirmed by local guidelines.",
+        ),
+    ),
+    "wheat": (
+        "Leaf rust risk",
+        68,
+        (
+            "Increase scouting around dense and shaded sections of the field.",
+            "Prioritize resistant varieties and timely foliar protection if thresholds are met.",
+            "Avoid unnecessary late irrigation that increases canopy humidity.",
+        ),
+    ),
+    "maize": (
+        "Northern leaf blight risk",
+        64,
+        (
+            "Scout for elongated gray-green lesions in lower to mid canopy.",
+            "Improve residue management and maintain field airflow.",
+            "Use targeted fungicide only if disease pressure escalates and thresholds are met.",
+        ),
+    ),
+}
+_GENERAL_PROFILE = (
+    "General moisture stress",
+    45,
+    (
+        "Inspect the lower canopy for early lesions and discoloration.",
+        "Reduce prolonged leaf wetness by improving airflow and irrigation timing.",
+    ),
+)
+# Fixed action plan entries per risk level; crop-specific suggestions are spliced in per call
+_DO_NOW_HIGH = ("Trigger high-risk protocol and notify field supervisor.",)
+_TODAY_HIGH = ("Capture geo-tagged photos and lesion notes from scouting zones.",)
+_THIS_WEEK_HIGH = (
+    "Review disease progression trend and recalibrate intervention thresholds.",
+    "Validate fungicide rotation and compliance with local advisory rules.",
+)
+_DO_NOW_MEDIUM = ("Increase scouting frequency in shaded and low-airflow zones.",)
+_TODAY_MEDIUM = ("Check irrigation timing and avoid late-evening canopy wetness.",)
+_THIS_WEEK_MEDIUM = (
+    "Track trend consistency before escalating to chemical controls.",
+    "Review drainage and canopy management practices for hotspots.",
+)
+_DO_NOW_LOW = ("Maintain routine monitoring and verify sensor calibration.",)
+_TODAY_LOW = ("Inspect representative plots and document baseline crop health.",)
+_THIS_WEEK_LOW = (
+    "Reassess risk thresholds using recent weather and disease observations.",
+    "Train field staff on early symptom spotting checklist.",
+)
+_OUTBREAK_WINDOWS = (
+    "Critical window: within 12 hours",
+    "High probability window: within 24 hours",
+    "Moderate probability window: within 48 hours",
+    "Watch window: within 72 hours",
+)
+_FORECAST_HORIZONS = (12, 24, 48, 72)
+
+
+class ParsedFeatures(NamedTuple):
+    """Feature values parsed once per event and shared by the scoring helpers."""
+    humidity: float
+    temperature: float
+    rain_forecast: float
+    soil_moisture: float
+    wind_speed: float
+    leaf_wetness: float
+    soil_temperature: float
+    soil_ph: float
+    solar_radiation: float
+    anomaly_score: float
+    crop_type: str  # lower-cased
+
+
+def parse_features(features: dict[str, Any]) -> ParsedFeatures:
+    """Read and coerce the scoring inputs from a feature dict, with the engine's defaults."""
+    get = features.get
+    return ParsedFeatures(
+        float(get("humidity", 0)),
+        float(get("temperature", 0)),
+        float(get("rain_forecast", 0)),
+        float(get("soil_moisture", 0)),
+        float(get("wind_speed", 0)),
+        float(get("leaf_wetness", 0)),
+        float(get("soil_temperature", 0)),
+        float(get("soil_ph", 7)),
+        float(get("solar_radiation", 500)),
+        float(get("anomaly_score", 0)),
+        str(get("crop_type", "unknown")).lower(),
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class RiskResult:
     risk_score: int
     risk_level: str
@@ -20,91 +185,171 @@ class RiskResult:
     alert_triggered: bool
 
 
+def _build_action_plan(
+    level: str,
+    suggested_actions: list[str],
+    disease_suggestions: list[str],
+) -> dict[str, list[str]]:
+    if level == "HIGH":
+        do_now = [*_DO_NOW_HIGH, *disease_suggestions[:2]]
+        today = [*suggested_actions[:2], *_TODAY_HIGH]
+        this_week = list(_THIS_WEEK_HIGH)
+    elif level == "MEDIUM":
+        do_now = [*_DO_NOW_MEDIUM, *suggested_actions[:1]]
+        today = [*disease_suggestions[:2], *_TODAY_MEDIUM]
+        this_week = list(_THIS_WEEK_MEDIUM)
+    else:
+        do_now = list(_DO_NOW_LOW)
+        today = list(_TODAY_LOW)
+        this_week = list(_THIS_WEEK_LOW)
+
+    return {
+        "do_now": do_now,
+        "today": today,
+        "this_week": this_week,
+    }
+
+
+@dataclass(slots=True, frozen=True)
+class RiskResultBatch:
+    """
+    Columnar results of DiseaseRiskEngine.score_batch. Per-event lists (reasons,
+    actions, trajectory, action plan) are only built when an item is accessed.
+    """
+    risk_score: np.ndarray  # int64
+    level_index: np.ndarray  # int64 index into _LEVEL_NAMES
+    fired_mask: np.ndarray  # int64 bitmask over _RULE_REASONS
+    predicted_disease: list[str]
+    disease_confidence: np.ndarray  # int64
+    disease_suggestions: list[list[str]]
+    outbreak_eta_hours: np.ndarray  # int64
+    window_index: np.ndarray  # int64 index into _OUTBREAK_WINDOWS
+    forecast_trajectory: np.ndarray  # int64, one column per _FORECAST_HORIZONS entry
+    alert_triggered: np.ndarray  # bool
+
+    @property
+    def risk_level(self) -> np.ndarray:
+        return np.array(_LEVEL_NAMES, dtype=object)[self.level_index]
+
+    def __len__(self) -> int:
+        return len(self.risk_score)
+
+    def __getitem__(self, index: int) -> RiskResult:
+        level = _LEVEL_NAMES[int(self.level_index[index])]
+        mask = int(self.fired_mask[index])
+        actions = list(_LEVEL_ACTIONS[level])
+        disease_suggestions = self.disease_suggestions[index]
+        return RiskResult(
+            risk_score=int(self.risk_score[index]),
+            risk_level=level,
+            reasons=[reason for bit, reason in enumerate(_RULE_REASONS) if mask >> bit & 1],
+            suggested_actions=actions,
+            predicted_disease=self.predicted_disease[index],
+            disease_confidence=int(self.disease_confidence[index]),
+            disease_suggestions=disease_suggestions,
+            outbreak_eta_hours=int(self.outbreak_eta_hours[index]),
+            outbreak_window=_OUTBREAK_WINDOWS[int(self.window_index[index])],
+            forecast_trajectory=[
+                {"hours": horizon, "risk_score": value}
+                for horizon, value in zip(_FORECAST_HORIZONS, self.forecast_trajectory[index].tolist())
+            ],
+            action_plan=_build_action_plan(level, actions, disease_suggestions),
+            alert_triggered=bool(self.alert_triggered[index]),
+        )
+
+    def __iter__(self) -> Iterator[RiskResult]:
+        return (self[index] for index in range(len(self)))
+
+
+def _score_columns(xp: Any, humidity, temperature, rain_forecast, soil_moisture, wind_speed,
+                   leaf_wetness, soil_temperature, soil_ph, solar_radiation, anomaly_score,
+                   crop_adjustment) -> tuple:
+    """
+    Rule cascade over feature columns with array module xp (numpy or cupy).
+    Returns score, level index into _LEVEL_NAMES, fired-rule bitmask, outbreak ETA,
+    outbreak window index and projected trajectory, all as integer arrays.
+    """
+    fired = (
+        humidity > 80,
+        (temperature >= 20) & (temperature <= 30),
+        rain_forecast >= 0.6,
+        leaf_wetness > 70,
+        soil_moisture > 70,
+        wind_speed < 2,
+        (soil_temperature >= 18) & (soil_temperature <= 28),
+        ~((soil_ph >= 5.8) & (soil_ph <= 7.2)),
+        (humidity > 80) & (solar_radiation < 280),
+        anomaly_score >= 1.0,
+    )
+    scores = crop_adjustment.astype(xp.int64)
+    fired_mask = xp.zeros_like(scores)
+    for bit, (points, hit) in enumerate(zip(_RULE_POINTS, fired)):
+        scores += points * hit
+        fired_mask |= hit.astype(xp.int64) << bit
+    scores = xp.clip(scores, 0, 100)
+    level_index = (scores >= _LEVEL_MED).astype(xp.int64) + (scores >= _LEVEL_HIGH)
+
+    eta = (72 - xp.maximum(0, scores - 35) * 1.15).astype(xp.int64)
+    eta -= (
+        8 * (humidity > 80)
+        + 10 * (leaf_wetness > 70)
+        + 8 * (rain_forecast > 0.65)
+        + 6 * (anomaly_score > 1.2)
+    )
+    eta = xp.clip(eta, 6, 72)
+    window_index = 3 - (eta <= 48).astype(xp.int64) - (eta <= 24) - (eta <= 12)
+
+    weather_push = (
+        5 * (humidity > 80)
+        + 6 * (rain_forecast > 0.6)
+        + 5 * (leaf_wetness > 70)
+        + 3 * (wind_speed < 2)
+    )
+    projected = xp.clip(
+        (scores + weather_push)[:, None] - xp.asarray([int(h * 0.22) for h in _FORECAST_HORIZONS]),
+        5,
+        100,
+    )
+    return scores, level_index, fired_mask, eta, window_index, projected
+
+
 class DiseaseRiskEngine:
-    def __init__(self) -> None:
+    def __init__(self, use_gpu: bool | None = None) -> None:
         self._last_level = "LOW"
+        # None picks CuPy automatically for batches of _GPU_MIN_BATCH events when it is installed
+        self.use_gpu = use_gpu
 
-    def _predict_disease(self, features: dict[str, Any], score: int) -> tuple[str, int, list[str]]:
-        crop_type = str(features.get("crop_type", "unknown")).lower()
-        humidity = float(features.get("humidity", 0))
-        temperature = float(features.get("temperature", 0))
-        leaf_wetness = float(features.get("leaf_wetness", 0))
-        rain_forecast = float(features.get("rain_forecast", 0))
-
-        disease = "General moisture stress"
-        confidence = 45
-        suggestions = [
-            "Inspect the lower canopy for early lesions and discoloration.",
-            "Reduce prolonged leaf wetness by improving airflow and irrigation timing.",
-        ]
+    def _predict_disease(self, features: ParsedFeatures, score: int) -> tuple[str, int, list[str]]:
+        crop_type = features.crop_type
+        humidity = features.humidity
+        temperature = features.temperature
+        leaf_wetness = features.leaf_wetness
+        rain_forecast = features.rain_forecast
 
         fungal_window = (
             (humidity > 78 and leaf_wetness > 65)
             or (rain_forecast > 0.55 and leaf_wetness > 60)
-            or (score >= 75 and temperature >= 18 and temperature <= 32)
+            or (score >= _LEVEL_HIGH and temperature >= 18 and temperature <= 32)
         )
 
-        if fungal_window:
-            if crop_type == "tomato":
-                disease = "Early blight (Alternaria) risk"
-                confidence = 72
-                suggestions = [
-                    "Remove infected lower leaves and sanitize tools after handling plants.",
-                    "Use preventive fungicide strategy with active ingredient rotation.",
-                    "Avoid overhead irrigation in late afternoon and evening.",
-                ]
-            elif crop_type == "potato":
-                disease = "Late blight risk"
-                confidence = 76
-                suggestions = [
-                    "Start preventive blight spray schedule based on local advisory guidance.",
-                    "Improve field drainage and avoid dense canopy humidity pockets.",
-                    "Scout high-risk zones twice daily after rainfall windows.",
-                ]
-            elif crop_type == "rice":
-                disease = "Rice blast risk"
-                confidence = 74
-                suggestions = [
-                    "Avoid excess nitrogen applications during high-risk humid windows.",
-                    "Maintain optimal spacing and water management to limit prolonged wetness.",
-                    "Apply targeted fungicide only when threshold is confirmed by local guidelines.",
-                ]
-            elif crop_type == "wheat":
-                disease = "Leaf rust risk"
+        profile = _FUNGAL_PROFILES.get(crop_type) if fungal_window else None
+        if profile is not None:
+            disease, confidence, suggestions = profile
+        else:
+            disease, confidence, suggestions = _GENERAL_PROFILE
+            if score >= _LEVEL_HIGH:
+                fallback = _FUNGAL_PROFILES.get(crop_type)
+                disease = fallback[0] if fallback is not None else "Fungal disease complex risk"
                 confidence = 68
-                suggestions = [
-                    "Increase scouting around dense and shaded sections of the field.",
-                    "Prioritize resistant varieties and timely foliar protection if thresholds are met.",
-                    "Avoid unnecessary late irrigation that increases canopy humidity.",
-                ]
-            elif crop_type == "maize":
-                disease = "Northern leaf blight risk"
-                confidence = 64
-                suggestions = [
-                    "Scout for elongated gray-green lesions in lower to mid canopy.",
-                    "Improve residue management and maintain field airflow.",
-                    "Use targeted fungicide only if disease pressure escalates and thresholds are met.",
-                ]
-
-        if score >= 75 and disease == "General moisture stress":
-            fallback_by_crop = {
-                "tomato": "Early blight (Alternaria) risk",
-                "potato": "Late blight risk",
-                "rice": "Rice blast risk",
-                "wheat": "Leaf rust risk",
-                "maize": "Northern leaf blight risk",
-            }
-            disease = fallback_by_crop.get(crop_type, "Fungal disease complex risk")
-            confidence = max(confidence, 68)
 
         confidence = min(95, max(confidence, int(score * 0.85)))
-        return disease, confidence, suggestions
+        return disease, confidence, list(suggestions)
 
-    def _estimate_outbreak_eta(self, features: dict[str, Any], score: int) -> tuple[int, str]:
-        humidity = float(features.get("humidity", 0))
-        rain_forecast = float(features.get("rain_forecast", 0))
-        leaf_wetness = float(features.get("leaf_wetness", 0))
-        anomaly_score = float(features.get("anomaly_score", 0))
+    def _estimate_outbreak_eta(self, features: ParsedFeatures, score: int) -> tuple[int, str]:
+        humidity = features.humidity
+        rain_forecast = features.rain_forecast
+        leaf_wetness = features.leaf_wetness
+        anomaly_score = features.anomaly_score
 
         eta = int(72 - max(0, score - 35) * 1.15)
         if humidity > 80:
@@ -119,20 +364,20 @@ class DiseaseRiskEngine:
         eta = max(6, min(72, eta))
 
         if eta <= 12:
-            window = "Critical window: within 12 hours"
+            window = _OUTBREAK_WINDOWS[0]
         elif eta <= 24:
-            window = "High probability window: within 24 hours"
+            window = _OUTBREAK_WINDOWS[1]
         elif eta <= 48:
-            window = "Moderate probability window: within 48 hours"
+            window = _OUTBREAK_WINDOWS[2]
         else:
-            window = "Watch window: within 72 hours"
+            window = _OUTBREAK_WINDOWS[3]
         return eta, window
 
-    def _forecast_trajectory(self, features: dict[str, Any], score: int) -> list[dict[str, int]]:
-        humidity = float(features.get("humidity", 0))
-        rain_forecast = float(features.get("rain_forecast", 0))
-        wind_speed = float(features.get("wind_speed", 0))
-        leaf_wetness = float(features.get("leaf_wetness", 0))
+    def _forecast_trajectory(self, features: ParsedFeatures, score: int) -> list[dict[str, int]]:
+        humidity = features.humidity
+        rain_forecast = features.rain_forecast
+        wind_speed = features.wind_speed
+        leaf_wetness = features.leaf_wetness
 
         weather_push = 0
         if humidity > 80:
@@ -145,7 +390,7 @@ class DiseaseRiskEngine:
             weather_push += 3
 
         points: list[dict[str, int]] = []
-        for horizon in (12, 24, 48, 72):
+        for horizon in _FORECAST_HORIZONS:
             decay = int(horizon * 0.22)
             projected = int(score + weather_push - decay)
             projected = max(5, min(100, projected))
@@ -153,160 +398,63 @@ class DiseaseRiskEngine:
 
         return points
 
-    def _build_action_plan(
-        self,
-        level: str,
-        suggested_actions: list[str],
-        disease_suggestions: list[str],
-    ) -> dict[str, list[str]]:
-        do_now: list[str] = []
-        today: list[str] = []
-        this_week: list[str] = []
-
-        if level == "HIGH":
-            do_now = [
-                "Trigger high-risk protocol and notify field supervisor.",
-                *disease_suggestions[:2],
-            ]
-            today = [
-                *suggested_actions[:2],
-                "Capture geo-tagged photos and lesion notes from scouting zones.",
-            ]
-            this_week = [
-                "Review disease progression trend and recalibrate intervention thresholds.",
-                "Validate fungicide rotation and compliance with local advisory rules.",
-            ]
-        elif level == "MEDIUM":
-            do_now = [
-                "Increase scouting frequency in shaded and low-airflow zones.",
-                *suggested_actions[:1],
-            ]
-            today = [
-                *disease_suggestions[:2],
-                "Check irrigation timing and avoid late-evening canopy wetness.",
-            ]
-            this_week = [
-                "Track trend consistency before escalating to chemical controls.",
-                "Review drainage and canopy management practices for hotspots.",
-            ]
-        else:
-            do_now = ["Maintain routine monitoring and verify sensor calibration."]
-            today = ["Inspect representative plots and document baseline crop health."]
-            this_week = [
-                "Reassess risk thresholds using recent weather and disease observations.",
-                "Train field staff on early symptom spotting checklist.",
-            ]
-
-        return {
-            "do_now": do_now,
-            "today": today,
-            "this_week": this_week,
-        }
-
     def score(self, features: dict[str, Any]) -> RiskResult:
         score = 0
         reasons: list[str] = []
         actions: list[str] = []
 
-        humidity = float(features.get("humidity", 0))
-        temperature = float(features.get("temperature", 0))
-        rain_forecast = float(features.get("rain_forecast", 0))
-        soil_moisture = float(features.get("soil_moisture", 0))
-        wind_speed = float(features.get("wind_speed", 0))
-        leaf_wetness = float(features.get("leaf_wetness", 0))
-        soil_temperature = float(features.get("soil_temperature", 0))
-        soil_ph = float(features.get("soil_ph", 7))
-        solar_radiation = float(features.get("solar_radiation", 500))
-        crop_type = str(features.get("crop_type", "unknown"))
-        anomaly_score = float(features.get("anomaly_score", 0))
-
-        if humidity > 80:
-            score += 25
-            reasons.append("Humidity is above 80%, creating fungal-friendly conditions.")
-
-        if 20 <= temperature <= 30:
-            score += 20
-            reasons.append("Temperature is in the 20–30°C fungal growth range.")
-
-        if rain_forecast >= 0.6:
-            score += 20
-            reasons.append("Rain is forecasted, increasing leaf wetness duration.")
-
-        if leaf_wetness > 70:
-            score += 12
-            reasons.append("Leaf wetness is elevated, increasing fungal germination likelihood.")
-
-        if soil_moisture > 70:
-            score += 10
-            reasons.append("Soil moisture is high, supporting pathogen persistence.")
+        parsed = parse_features(features)
+        (
+            humidity,
+            temperature,
+            rain_forecast,
+            soil_moisture,
+            wind_speed,
+            leaf_wetness,
+            soil_temperature,
+            soil_ph,
+            solar_radiation,
+            anomaly_score,
+            crop_type,
+        ) = parsed
+
+        fired = (
+            humidity > 80,
+            20 <= temperature <= 30,
+            rain_forecast >= 0.6,
+            leaf_wetness > 70,
+            soil_moisture > 70,
+            wind_speed < 2,
+            18 <= soil_temperature <= 28,
+            not (5.8 <= soil_ph <= 7.2),
+            humidity > 80 and solar_radiation < 280,
+            anomaly_score >= 1.0,
+        )
+        for hit, points, reason in zip(fired, _RULE_POINTS, _RULE_REASONS):
+            if hit:
+                score += points
+                reasons.append(reason)
 
-        if wind_speed < 2:
-            score += 10
-            reasons.append("Low wind speed can reduce canopy drying.")
-
-        if 18 <= soil_temperature <= 28:
-            score += 8
-            reasons.append("Soil temperature supports disease development dynamics.")
-
-        if not (5.8 <= soil_ph <= 7.2):
-            score += 6
-            reasons.append("Soil pH is outside the preferred range, increasing plant stress.")
-
-        if humidity > 80 and solar_radiation < 280:
-            score += 6
-            reasons.append("Low solar radiation with high humidity may prolong canopy wetness.")
-
-        if anomaly_score >= 1.0:
-            score += 10
-            reasons.append("Recent sensor pattern deviates from rolling baseline.")
-
-        crop_adjustment = {
-            "rice": 8,
-            "tomato": 8,
-            "potato": 6,
-            "wheat": 4,
-            "maize": 3,
-            "cotton": 4,
-        }.get(crop_type.lower(), 2)
-        score += crop_adjustment
+        score += _CROP_ADJUSTMENT.get(crop_type, 2)
 
         score = max(0, min(100, score))
 
-        if score >= 75:
+        if score >= _LEVEL_HIGH:
             level = "HIGH"
-            actions.extend(
-                [
-                    "Increase field scouting frequency to twice daily.",
-                    "Improve air circulation and avoid overhead irrigation.",
-                    "Prepare targeted fungicide plan based on local agronomy guidance.",
-                ]
-            )
-        elif score >= 45:
+        elif score >= _LEVEL_MED:
             level = "MEDIUM"
-            actions.extend(
-                [
-                    "Monitor humidity and rainfall windows closely.",
-                    "Inspect lower canopy and shaded zones for early signs.",
-                    "Optimize irrigation timing for morning-only watering.",
-                ]
-            )
         else:
             level = "LOW"
-            actions.extend(
-                [
-                    "Continue routine monitoring and maintain hygiene practices.",
-                    "Keep drainage and ventilation in good condition.",
-                ]
-            )
+        actions.extend(_LEVEL_ACTIONS[level])
 
         alert_triggered = level == "HIGH" and self._last_level != "HIGH"
         self._last_level = level
         predicted_disease, disease_confidence, disease_suggestions = self._predict_disease(
-            features, score
+            parsed, score
         )
-        outbreak_eta_hours, outbreak_window = self._estimate_outbreak_eta(features, score)
-        forecast_trajectory = self._forecast_trajectory(features, score)
-        action_plan = self._build_action_plan(level, actions, disease_suggestions)
+        outbreak_eta_hours, outbreak_window = self._estimate_outbreak_eta(parsed, score)
+        forecast_trajectory = self._forecast_trajectory(parsed, score)
+        action_plan = _build_action_plan(level, actions, disease_suggestions)
 
         return RiskResult(
             risk_score=score,
@@ -322,3 +470,92 @@ class DiseaseRiskEngine:
             action_plan=action_plan,
             alert_triggered=alert_triggered,
         )
+
+    def score_batch(self, features: list[dict[str, Any]]) -> RiskResultBatch:
+        """
+        Score many feature dicts at once; batch[i] matches calling score() on each in order.
+        Rule thresholds, outbreak ETA and forecast trajectory are evaluated as NumPy column
+        operations (CuPy on the GPU for very large batches) and returned as columns;
+        reasons and action plans are rebuilt from the fired-rule bitmask on access.
+        """
+        count = len(features)
+        if count == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return RiskResultBatch(
+                risk_score=empty,
+                level_index=empty,
+                fired_mask=empty,
+                predicted_disease=[],
+                disease_confidence=empty,
+                disease_suggestions=[],
+                outbreak_eta_hours=empty,
+                window_index=empty,
+                forecast_trajectory=np.zeros((0, len(_FORECAST_HORIZONS)), dtype=np.int64),
+                alert_triggered=np.zeros(0, dtype=bool),
+            )
+
+        parsed = [parse_features(f) for f in features]
+        (
+            humidity,
+            temperature,
+            rain_forecast,
+            soil_moisture,
+            wind_speed,
+            leaf_wetness,
+            soil_temperature,
+            soil_ph,
+            solar_radiation,
+            anomaly_score,
+        ) = np.array([p[:-1] for p in parsed], dtype=np.float64).T
+        crop_adjustment = np.fromiter(
+            (_CROP_ADJUSTMENT.get(p.crop_type, 2) for p in parsed),
+            dtype=np.int64,
+            count=count,
+        )
+
+        columns = (
+            humidity,
+            temperature,
+            rain_forecast,
+            soil_moisture,
+            wind_speed,
+            leaf_wetness,
+            soil_temperature,
+            soil_ph,
+            solar_radiation,
+            anomaly_score,
+            crop_adjustment,
+        )
+        use_gpu = self.use_gpu if self.use_gpu is not None else count >= _GPU_MIN_BATCH
+        if use_gpu and cp is not None:
+            # Only the small integer outputs come back to the host
+            outputs = _score_columns(cp, *(cp.asarray(column) for column in columns))
+            scores, level_index, fired_mask, eta, window_index, projected = map(cp.asnumpy, outputs)
+        else:
+            scores, level_index, fired_mask, eta, window_index, projected = _score_columns(np, *columns)
+
+        # An alert fires on each transition into HIGH, continuing from the previous call
+        is_high = level_index == 2
+        was_high = np.empty_like(is_high)
+        was_high[0] = self._last_level == "HIGH"
+        was_high[1:] = is_high[:-1]
+        self._last_level = _LEVEL_NAMES[int(level_index[-1])]
+
+        predictions = [
+            self._predict_disease(parsed_feature, score)
+            for parsed_feature, score in zip(parsed, scores.tolist())
+        ]
+        return RiskResultBatch(
+            risk_score=scores,
+            level_index=level_index,
+            fired_mask=fired_mask,
+            predicted_disease=[disease for disease, _, _ in predictions],
+            disease_confidence=np.fromiter(
+                (confidence for _, confidence, _ in predictions), dtype=np.int64, count=count
+            ),
+            disease_suggestions=[suggestions for _, _, suggestions in predictions],
+            outbreak_eta_hours=eta,
+            window_index=window_index,
+            forecast_trajectory=projected,
+            alert_triggered=is_high & ~was_high,
+        )
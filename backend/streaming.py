@@ -3,19 +3,46 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Callable
 
-from .etl_pipeline import PathwayETLPipeline
+import msgspec
+
+from .etl_pipeline import PathwayETLPipeline, SensorEvent
 
 logger = logging.getLogger(__name__)
 
+# Typed decoders: payloads are parsed straight into SensorEvent and validated in the same
+# pass; strict=False still accepts numbers sent as strings, as float() did before
+_decode_event_json = msgspec.json.Decoder(SensorEvent, strict=False).decode
+_decode_event_msgpack = msgspec.msgpack.Decoder(SensorEvent, strict=False).decode
+_decode_raw_list = msgspec.json.Decoder(list[msgspec.Raw]).decode
+
+
+def _decode_events(data: bytes | str) -> list[dict[str, Any]]:
+    """
+    Decode a JSON event or array of events (file lines, HTTP bodies, SSE data) into event
+    dicts; events that fail validation are logged and skipped without dropping the rest.
+    """
+    data = data.strip()
+    items = _decode_raw_list(data) if data[:1] in (b"[", "[") else (data,)
+    events = []
+    for item in items:
+        try:
+            events.append(msgspec.structs.asdict(_decode_event_json(item)))
+        except msgspec.ValidationError as e:
+            logger.error("Rejected sensor event: %s", e)
+    return events
+
 
 class StreamSource(ABC):
     """Abstract base class for data stream sources."""
 
+    # Set once a finite source (e.g. a file) has no more events to return
+    exhausted: bool = False
+
     @abstractmethod
     async def connect(self) -> None:
         """Connect to the data source."""
@@ -26,6 +53,11 @@ class StreamSource(ABC):
         """Read events from the source."""
         pass
 
+    @abstractmethod
+    async def next_batch(self, max_n: int, timeout_ms: int = 50) -> list[dict[str, Any]]:
+        """Return up to max_n events, or an empty list if none arrived within timeout_ms."""
+        pass
+
     @abstractmethod
     async def close(self) -> None:
         """Close the connection."""
@@ -39,29 +71,48 @@ class KafkaStreamSource(StreamSource):
         self,
         bootstrap_servers: str = "localhost:9092",
         topic: str = "sensor-data",
-        group_id: str = "agriguardian-consumer"
+        group_id: str = "agriguardian-consumer",
+        value_format: str = "json",
+        consumer_config: dict[str, Any] | None = None,
     ):
         self.bootstrap_servers = bootstrap_servers
         self.topic = topic
         self.group_id = group_id
+        # Extra AIOKafkaConsumer options, e.g. fetch_min_bytes / max_poll_records for batching
+        self.consumer_config = consumer_config or {}
         self.consumer = None
+        if value_format == "json":
+            self._decode_event = _decode_event_json
+        elif value_format == "msgpack":
+            self._decode_event = _decode_event_msgpack
+        else:
+            raise ValueError("Invalid value_format. Use one of: json, msgpack")
+
+    def _decode(self, value: bytes) -> dict[str, Any] | None:
+        """Kafka value deserializer; a malformed record becomes None and is skipped."""
+        try:
+            return msgspec.structs.asdict(self._decode_event(value))
+        except msgspec.DecodeError as e:
+            logger.error("Rejected sensor event: %s", e)
+            return None
 
     async def connect(self) -> None:
         """Connect to Kafka broker."""
         try:
-            from kafka import KafkaConsumer
-            self.consumer = KafkaConsumer(
-                self.topic,
-                bootstrap_servers=self.bootstrap_servers.split(","),
-                group_id=self.group_id,
-                auto_offset_reset="earliest",
-                value_deserializer=lambda m: json.loads(m.decode("utf-8")),
-                consumer_timeout_ms=30000
-            )
-            logger.info(f"Connected to Kafka topic: {self.topic}")
+            from aiokafka import AIOKafkaConsumer
         except ImportError:
-            logger.error("kafka-python not installed")
+            logger.error("aiokafka not installed")
             raise
+        self.consumer = AIOKafkaConsumer(
+            self.topic,
+            bootstrap_servers=self.bootstrap_servers.split(","),
+            group_id=self.group_id,
+            auto_offset_reset="earliest",
+            value_deserializer=self._decode,
+            **self.consumer_config,
+        )
+        await self.consumer.start()
+        logger.info("Connected to Kafka topic: %s", self.topic)
 
     async def read_events(self):
         """Read and yield events from Kafka stream."""
@@ -69,15 +120,33 @@ class KafkaStreamSource(StreamSource):
             await self.connect()
 
         try:
-            for message in self.consumer:
-                yield message.value
+            async for message in self.consumer:
+                if message.value is not None:
+                    yield message.value
         except Exception as e:
-            logger.error(f"Error reading from Kafka: {e}")
+            logger.error("Error reading from Kafka: %s", e)
+
+    async def next_batch(self, max_n: int, timeout_ms: int = 50) -> list[dict[str, Any]]:
+        """Fetch up to max_n records, waiting at most timeout_ms without blocking the event loop."""
+        if self.consumer is None:
+            await self.connect()
+
+        try:
+            records = await self.consumer.getmany(timeout_ms=timeout_ms, max_records=max_n)
+        except Exception as e:
+            logger.error("Error reading from Kafka: %s", e)
+            return []
+        return [
+            message.value
+            for partition in records.values()
+            for message in partition
+            if message.value is not None
+        ]
 
     async def close(self) -> None:
         """Close Kafka consumer."""
         if self.consumer:
-            self.consumer.close()
+            await self.consumer.stop()
             logger.info("Kafka consumer closed")
 
 
@@ -88,13 +157,16 @@ class HTTPStreamSource(StreamSource):
         self.endpoint = endpoint
         self.poll_interval = poll_interval
         self.session = None
+        self._pending: list[dict[str, Any]] = []
+        self._next_poll = 0.0
+        self._etag: str | None = None
 
     async def connect(self) -> None:
         """Establish HTTP session."""
         try:
             import httpx
             self.session = httpx.AsyncClient()
-            logger.info(f"Connected to HTTP endpoint: {self.endpoint}")
+            logger.info("Connected to HTTP endpoint: %s", self.endpoint)
         except ImportError:
             logger.error("httpx not installed")
             raise
@@ -108,20 +180,43 @@ class HTTPStreamSource(StreamSource):
             try:
                 response = await self.session.get(self.endpoint)
                 response.raise_for_status()
-                data = response.json()
-
-                # Assume data is a list of events or a single event
-                if isinstance(data, list):
-                    for event in data:
-                        yield event
-                else:
-                    yield data
+                # The body may be a list of events or a single event
+                for event in _decode_events(response.content):
+                    yield event
 
                 await asyncio.sleep(self.poll_interval)
             except Exception as e:
-                logger.error(f"Error polling HTTP endpoint: {e}")
+                logger.error("Error polling HTTP endpoint: %s", e)
                 await asyncio.sleep(self.poll_interval)
 
+    async def next_batch(self, max_n: int, timeout_ms: int = 50) -> list[dict[str, Any]]:
+        """Return events from the last response, fetching a new one once poll_interval has passed."""
+        if self.session is None:
+            await self.connect()
+
+        if not self._pending:
+            delay = self._next_poll - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_poll = time.monotonic() + self.poll_interval
+            # Conditional GET: an unchanged payload comes back as an empty 304
+            headers = {"If-None-Match": self._etag} if self._etag else None
+            try:
+                response = await self.session.get(self.endpoint, headers=headers)
+                if response.status_code == 304:
+                    return []
+                response.raise_for_status()
+                # The body may be a list of events or a single event
+                events = _decode_events(response.content)
+            except Exception as e:
+                logger.error("Error polling HTTP endpoint: %s", e)
+                return []
+            self._etag = response.headers.get("ETag")
+            self._pending = events
+
+        batch, self._pending = self._pending[:max_n], self._pending[max_n:]
+        return batch
+
     async def close(self) -> None:
         """Close HTTP session."""
         if self.session:
@@ -129,6 +224,97 @@ class HTTPStreamSource(StreamSource):
             logger.info("HTTP session closed")
 
 
+class SSEStreamSource(StreamSource):
+    """Server-Sent Events source: the server pushes events as they arrive instead of being polled."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        queue_size: int = 10000,
+    ):
+        self.endpoint = endpoint
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.session = None
+        self._aconnect_sse = None
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=queue_size)
+        self._reader: asyncio.Task | None = None
+
+    async def connect(self) -> None:
+        """Create the HTTP client used for the event stream."""
+        try:
+            import httpx
+            from httpx_sse import aconnect_sse
+            # No read timeout: the connection stays open between pushed events
+            self.session = httpx.AsyncClient(timeout=httpx.Timeout(10.0, read=None))
+            self._aconnect_sse = aconnect_sse
+            logger.info("Connected to SSE endpoint: %s", self.endpoint)
+        except ImportError:
+            logger.error("httpx-sse not installed")
+            raise
+
+    async def read_events(self):
+        """Yield events as the server pushes them, reconnecting with exponential backoff."""
+        if self.session is None:
+            await self.connect()
+
+        delay = self.reconnect_delay
+        while True:
+            try:
+                async with self._aconnect_sse(self.session, "GET", self.endpoint) as event_source:
+                    event_source.response.raise_for_status()
+                    delay = self.reconnect_delay
+                    async for sse in event_source.aiter_sse():
+                        if not sse.data:
+                            continue
+                        # The data may be a list of events or a single event
+                        for event in _decode_events(sse.data):
+                            yield event
+                logger.warning("SSE stream ended, reconnecting in %.1fs", delay)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error reading SSE stream: %s; reconnecting in %.1fs", e, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def next_batch(self, max_n: int, timeout_ms: int = 50) -> list[dict[str, Any]]:
+        """Return up to max_n pushed events, waiting at most timeout_ms for the first one."""
+        if self.session is None:
+            await self.connect()
+        if self._reader is None:
+            self._reader = asyncio.create_task(self._fill_queue())
+
+        try:
+            first = await asyncio.wait_for(self._queue.get(), timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            return []
+        batch = [first]
+        while len(batch) < max_n and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _fill_queue(self) -> None:
+        """Background reader feeding next_batch; blocks on a full queue for backpressure."""
+        async for event in self.read_events():
+            await self._queue.put(event)
+
+    async def close(self) -> None:
+        """Stop the reader and close the HTTP client."""
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        if self.session:
+            await self.session.aclose()
+            logger.info("SSE session closed")
+
+
 class FileStreamSource(StreamSource):
     """File-based stream source for testing and local development."""
 
@@ -140,25 +326,45 @@ class FileStreamSource(StreamSource):
     async def connect(self) -> None:
         """Open file for reading."""
         try:
-            self.file = open(self.file_path, "r")
-            logger.info(f"Opened file stream: {self.file_path}")
+            self.file = await asyncio.to_thread(open, self.file_path, "rb")
+            logger.info("Opened file stream: %s", self.file_path)
         except Exception as e:
-            logger.error(f"Error opening file: {e}")
+            logger.error("Error opening file: %s", e)
             raise
 
     async def read_events(self):
-        """Read events from file (one JSON per line)."""
+        """Read events from file (one JSON per line), batch_size lines per worker-thread read."""
         if self.file is None:
             await self.connect()
 
-        try:
-            for line in self.file:
-                line = line.strip()
-                if line:
-                    event = json.loads(line)
-                    yield event
-        except Exception as e:
-            logger.error(f"Error reading from file: {e}")
+        while not self.exhausted:
+            for event in await asyncio.to_thread(self._read_batch, self.batch_size):
+                yield event
+
+    async def next_batch(self, max_n: int, timeout_ms: int = 50) -> list[dict[str, Any]]:
+        """Read up to max_n JSON lines; marks the source exhausted at end of file."""
+        if self.file is None:
+            await self.connect()
+
+        # Disk reads run off the event loop so other sources and WebSockets keep going
+        return await asyncio.to_thread(self._read_batch, max_n)
+
+    def _read_batch(self, max_n: int) -> list[dict[str, Any]]:
+        """Blocking read of up to max_n decoded events."""
+        batch: list[dict[str, Any]] = []
+        while len(batch) < max_n:
+            line = self.file.readline()
+            if not line:
+                self.exhausted = True
+                break
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                batch.extend(_decode_events(line))
+            except Exception as e:
+                logger.error("Error reading from file: %s", e)
+        return batch
 
     async def close(self) -> None:
         """Close file."""
@@ -177,17 +383,26 @@ class StreamProcessor:
         self,
         source: StreamSource,
         etl_pipeline: PathwayETLPipeline,
-        batch_size: int = 10
+        batch_size: int = 10,
+        batch_timeout_ms: int = 50,
     ):
         self.source = source
         self.etl_pipeline = etl_pipeline
         self.batch_size = batch_size
+        self.batch_timeout_ms = batch_timeout_ms
         self.handlers: list[Callable[[dict[str, Any]], None]] = []
+        # Split once at registration so dispatch doesn't re-check each handler per event
+        self._sync_handlers: list[Callable[[dict[str, Any]], None]] = []
+        self._async_handlers: list[Callable[[dict[str, Any]], Any]] = []
         self.running = False
 
     def add_handler(self, handler: Callable[[dict[str, Any]], None]) -> None:
         """Add a handler to be called for each processed event."""
         self.handlers.append(handler)
+        if asyncio.iscoroutinefunction(handler):
+            self._async_handlers.append(handler)
+        else:
+            self._sync_handlers.append(handler)
 
     async def start(self) -> None:
         """Start processing stream."""
@@ -195,39 +410,52 @@ class StreamProcessor:
         self.running = True
 
         try:
-            async for event in self._event_stream():
-                # Process through ETL pipeline
-                try:
-                    processed = self.etl_pipeline.process_batch([event])
-                    
-                    # Call all handlers with processed data
-                    for handler in self.handlers:
-                        await self._call_handler(handler, {
-                            "raw": event,
-                            "processed": processed[0].__dict__ if processed else None
-                        })
-                except Exception as e:
-                    logger.error(f"Error processing event: {e}")
+            # One await per fetched batch (up to batch_size events, or whatever arrived
+            # within batch_timeout_ms) instead of one async-generator step per event
+            while self.running:
+                batch = await self.source.next_batch(self.batch_size, self.batch_timeout_ms)
+                if not batch:
+                    if self.source.exhausted:
+                        break
+                    await asyncio.sleep(0)
+                    continue
+                await self._process_batch(batch)
 
         except asyncio.CancelledError:
             logger.info("Stream processing cancelled")
         finally:
             await self.stop()
 
-    async def _event_stream(self):
-        """Async generator wrapper for source events."""
-        async for event in self.source.read_events():
-            yield event
-
-    async def _call_handler(self, handler: Callable, event: dict[str, Any]) -> None:
-        """Call handler, supporting both sync and async."""
+    async def _process_batch(self, events: list[dict[str, Any]]) -> None:
+        """Run a batch through the ETL pipeline and call handlers for each event."""
         try:
-            if asyncio.iscoroutinefunction(handler):
-                await handler(event)
-            else:
-                handler(event)
+            results = self.etl_pipeline.process_events(events)
         except Exception as e:
-            logger.error(f"Error in handler: {e}")
+            logger.error("Error processing batch: %s", e)
+            return
+
+        sync_handlers = self._sync_handlers
+        async_handlers = self._async_handlers
+        for event, processed in results:
+            message = {"raw": event, "processed": processed.to_dict()}
+            for handler in sync_handlers:
+                try:
+                    handler(message)
+                except Exception as e:
+                    logger.error("Error in handler: %s", e)
+            if len(async_handlers) == 1:
+                try:
+                    await async_handlers[0](message)
+                except Exception as e:
+                    logger.error("Error in handler: %s", e)
+            elif async_handlers:
+                # Independent async handlers (e.g. broadcast + alert webhook) overlap their I/O
+                outcomes = await asyncio.gather(
+                    *(handler(message) for handler in async_handlers), return_exceptions=True
+                )
+                for outcome in outcomes:
+                    if isinstance(outcome, Exception):
+                        logger.error("Error in handler: %s", outcome)
 
     async def stop(self) -> None:
         """Stop processing stream."""
@@ -243,7 +471,7 @@ class StreamBuffer:
         self.max_size = max_size
         self.timeout = timeout
         self.buffer: list[dict[str, Any]] = []
-        self.last_flush = asyncio.get_event_loop().time()
+        self.last_flush = time.monotonic()
 
     def add(self, event: dict[str, Any]) -> bool:
         """Add event to buffer. Returns True if buffer should be flushed."""
@@ -252,17 +480,16 @@ class StreamBuffer:
         if len(self.buffer) >= self.max_size:
             return True
         
-        current_time = asyncio.get_event_loop().time()
-        if current_time - self.last_flush >= self.timeout:
+        if time.monotonic() - self.last_flush >= self.timeout:
             return True
         
         return False
 
     def flush(self) -> list[dict[str, Any]]:
-        """Get and clear buffer."""
-        result = self.buffer[:]
-        self.buffer.clear()
-        self.last_flush = asyncio.get_event_loop().time()
+        """Hand over the buffered events and start a fresh buffer (no copy)."""
+        result = self.buffer
+        self.buffer = []
+        self.last_flush = time.monotonic()
         return result
 
     def is_empty(self) -> bool:
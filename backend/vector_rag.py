@@ -2,22 +2,303 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import mmap
 import os
 import re
+import struct
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
+from sqlalchemy import delete, func, insert, select, text, update
+
+try:
+    import hnswlib  # type: ignore
+except Exception:
+    hnswlib = None  # type: ignore
+
+try:
+    import simsimd  # type: ignore
+except Exception:
+    simsimd = None  # type: ignore
 
 from .db import RAGChunk, RAGDocument, DatabaseManager, db
 
 # Initialize embedding model (lightweight + fast)
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"  # 384-dim, 22MB, suitable for CPU
 
+# Below this many chunks the exact matrix scan is already fast, so no HNSW index is built
+_ANN_MIN_CHUNKS = 5000
+_ANN_EF = 50
+# Recent question embeddings kept per VectorRAG; repeated chat questions skip the model
+_QUESTION_CACHE_SIZE = 1024
+_MIN_SIMILARITY = 0.1
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+
+class _OnnxEmbedder:
+    """
+    The embedding model exported to ONNX with dynamic int8 quantization and run on
+    onnxruntime (tokenizer + forward + mean pooling). Exposes the subset of
+    SentenceTransformer.encode used here. The export runs once and is cached on disk.
+    """
+
+    def __init__(self, cache_dir: Path):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        model_file = cache_dir / "model_quantized.onnx"
+        if not model_file.exists():
+            from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+            model_id = f"sentence-transformers/{EMBEDDING_MODEL}"
+            model = ORTModelForFeatureExtraction.from_pretrained(model_id, export=True)
+            ORTQuantizer.from_pretrained(model).quantize(
+                save_dir=cache_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False),
+            )
+            AutoTokenizer.from_pretrained(model_id).save_pretrained(cache_dir)
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = int(os.getenv("ONNX_INTRA_OP_THREADS", "0"))
+        self.session = ort.InferenceSession(str(model_file), options, providers=["CPUExecutionProvider"])
+        self.input_names = {node.name for node in self.session.get_inputs()}
+        self.tokenizer = AutoTokenizer.from_pretrained(cache_dir)
+
+    def encode(
+        self,
+        sentences: str | list[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        show_progress_bar: bool = False,
+        normalize_embeddings: bool = False,
+    ) -> np.ndarray:
+        texts = [sentences] if isinstance(sentences, str) else list(sentences)
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                texts[start:start + batch_size], padding=True, truncation=True, max_length=256, return_tensors="np"
+            )
+            inputs = {name: value for name, value in encoded.items() if name in self.input_names}
+            hidden = self.session.run(None, inputs)[0]
+            mask = encoded["attention_mask"][..., None].astype(np.float32)
+            batches.append((hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9))
+
+        embeddings = np.vstack(batches).astype(np.float32) if batches else np.zeros((0, 384), dtype=np.float32)
+        if normalize_embeddings:
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-8
+        return embeddings[0] if isinstance(sentences, str) else embeddings
+
+
+_EMBEDDER: Any = None
+_EMBEDDER_LOCK = threading.Lock()
+
+
+def _get_embedder() -> Any:
+    """Load the embedding model once per process and share it across VectorRAG instances."""
+    global _EMBEDDER
+    with _EMBEDDER_LOCK:
+        if _EMBEDDER is None:
+            if os.getenv("RAG_EMBEDDING_BACKEND", "torch").strip().lower() == "onnx":
+                cache_dir = Path(os.getenv("RAG_ONNX_DIR", Path(__file__).resolve().parent / ".onnx"))
+                try:
+                    _EMBEDDER = _OnnxEmbedder(cache_dir)
+                except Exception as e:
+                    print(f"ONNX embedder unavailable, using SentenceTransformer: {e}")
+            if _EMBEDDER is None:
+                _EMBEDDER = SentenceTransformer(EMBEDDING_MODEL)
+        return _EMBEDDER
+
+
+def _embedder_name(embedder: Any) -> str:
+    """Identity of the loaded embedder; the int8 ONNX export's vectors differ slightly from torch's."""
+    return f"{EMBEDDING_MODEL}-onnx-int8" if isinstance(embedder, _OnnxEmbedder) else EMBEDDING_MODEL
+
+
+def _quantize(vector: Any) -> tuple[np.ndarray, float]:
+    """Quantize an embedding to int8 codes with a symmetric per-vector scale."""
+    values = np.asarray(vector, dtype=np.float32)
+    scale = float(np.abs(values).max()) / 127 or 1.0
+    return np.round(values / scale).astype(np.int8), scale
+
+
+def _encode_vector(vector: Any) -> bytes:
+    """Serialize an embedding as int8 codes followed by a little-endian float32 scale."""
+    codes, scale = _quantize(vector)
+    return codes.tobytes() + struct.pack("<f", scale)
+
+
+def _decode_vector(raw: bytes) -> tuple[np.ndarray, float]:
+    """Deserialize int8 codes and their scale; dequantize with codes * scale."""
+    codes = np.frombuffer(raw, dtype=np.int8, count=len(raw) - 4)
+    (scale,) = struct.unpack_from("<f", raw, len(raw) - 4)
+    return codes, scale
+
+
+def _legacy_vector(raw: Any) -> list[float] | None:
+    """
+    The embedding of a vector stored as JSON text by older versions, or None for the
+    current binary format. On PostgreSQL the migrated column holds that text as bytes.
+    """
+    if isinstance(raw, str):
+        return json.loads(raw)
+    if raw[:1] == b"[" and raw[-1:] == b"]":
+        try:
+            return json.loads(raw)
+        except ValueError:
+            # Binary codes that happen to start with "[" and end with "]"
+            return None
+    return None
+
+
+def _unit_rows(codes: np.ndarray) -> np.ndarray:
+    """Float32 copy of int8 code rows scaled to unit length."""
+    matrix = codes.astype(np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-8
+    return matrix
+
+
+def _content_hash(raw: bytes) -> str:
+    """Change-detection fingerprint of a document's bytes (not a security boundary)."""
+    return hashlib.blake2b(raw, digest_size=32).hexdigest()
+
+
+def _file_stamps(*paths: Path) -> dict[str, list[int]]:
+    """Size and mtime of each file, to tell a saved file from one replaced since."""
+    stamps = {}
+    for path in paths:
+        stat = path.stat()
+        stamps[path.name] = [stat.st_size, stat.st_mtime_ns]
+    return stamps
+
+
+def _hash_file(path: Path) -> str:
+    """_content_hash of a file, read through a memory map instead of into a bytes copy."""
+    with path.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return _content_hash(b"")
+        with mapped:
+            return _content_hash(mapped)
+
+
+def _decode_document(raw: bytes) -> str:
+    """Decode document bytes as UTF-8 with universal newlines, like Path.read_text."""
+    return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _chunk_text(text: str, chunk_size: int) -> list[str]:
+    """Split text into sentence-aligned chunks of about chunk_size words with overlap."""
+    sentences = _SENTENCE_BOUNDARY.split(text)
+    # Word counts are computed once per sentence and carried alongside the current chunk
+    lengths = [len(sentence.split()) for sentence in sentences]
+    chunks = []
+    current_chunk = []
+    current_lengths = []
+    current_length = 0
+
+    for sentence, sentence_length in zip(sentences, lengths):
+        if current_length + sentence_length > chunk_size:
+            if current_chunk:
+                chunks.append(" ".join(current_chunk))
+                # Keep overlap: last ~50% of previous chunk
+                keep = -len(current_chunk) // 2
+                current_chunk = current_chunk[keep:]
+                current_lengths = current_lengths[keep:]
+                current_length = sum(current_lengths)
+
+        current_chunk.append(sentence)
+        current_lengths.append(sentence_length)
+        current_length += sentence_length
+
+    if current_chunk:
+        chunks.append(" ".join(current_chunk))
+
+    return chunks
+
+
+def _context_key(live_context: dict[str, Any], retrieved: str) -> bytes:
+    """
+    Fingerprint of what an LLM answer depends on besides the question: the retrieved
+    text plus the coarse live state (raw telemetry drifts every reading, so it is left out).
+    """
+    risk_score = live_context.get("risk_score")
+    fingerprint = (
+        live_context.get("crop_type"),
+        live_context.get("risk_level"),
+        live_context.get("predicted_disease"),
+        live_context.get("weather_condition"),
+        round(risk_score, -1) if isinstance(risk_score, (int, float)) else None,
+    )
+    return hashlib.blake2b(f"{fingerprint!r}\n{retrieved}".encode(), digest_size=16).digest()
+
+
+class SemanticCache:
+    """
+    TTL + LRU cache of LLM answers. A lookup hits when an unexpired entry has the same
+    context key and a question embedding with cosine similarity >= threshold.
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 300.0, threshold: float = 0.85):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self._entries: OrderedDict[int, tuple[bytes, np.ndarray, str, float]] = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(vector: Any) -> np.ndarray:
+        values = np.asarray(vector, dtype=np.float32)
+        # sqrt(vdot) skips np.linalg.norm's dtype/axis dispatch on a single 1-D vector
+        return values / (np.sqrt(np.vdot(values, values)) + 1e-8)
+
+    def get(self, context_key: bytes, vector: Any) -> str | None:
+        """Return the closest cached answer for this context, or None."""
+        query = self._normalize(vector)
+        now = time.monotonic()
+        with self._lock:
+            best_id, best_score = None, self.threshold
+            for entry_id, (key, cached, _answer, expires_at) in list(self._entries.items()):
+                if expires_at <= now:
+                    del self._entries[entry_id]
+                    continue
+                if key != context_key:
+                    continue
+                score = float(np.dot(query, cached))
+                if score >= best_score:
+                    best_id, best_score = entry_id, score
+
+            if best_id is None:
+                return None
+            self._entries.move_to_end(best_id)
+            return self._entries[best_id][2]
+
+    def put(self, context_key: bytes, vector: Any, answer: str) -> None:
+        """Store an answer, evicting the least recently used entries beyond max_size."""
+        with self._lock:
+            self._entries[self._next_id] = (
+                context_key,
+                self._normalize(vector),
+                answer,
+                time.monotonic() + self.ttl_seconds,
+            )
+            self._next_id += 1
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
 
 @dataclass
 class RetrievedChunk:
@@ -34,9 +315,23 @@ class VectorRAG:
     def __init__(self, knowledge_dir: Path | None = None, db_manager: DatabaseManager = db):
         self.knowledge_dir = knowledge_dir or Path(__file__).resolve().parent / "knowledge"
         self.db_manager = db_manager
-        self.embedder = SentenceTransformer(EMBEDDING_MODEL)
+        self.embedder = _get_embedder()
+        self.embedding_model = _embedder_name(self.embedder)
+        # Saved matrix and HNSW index, kept apart per database and embedder so neither can
+        # be mistaken for the other's
+        index_key = _content_hash(f"{db_manager.database_url}\n{self.embedding_model}".encode())[:16]
+        self.index_dir = self.knowledge_dir / ".index" / index_key
         self.chunk_size = 300
         self.chunk_overlap = 50
+        # Near-duplicate questions in the same field state reuse the previous LLM answer
+        self.response_cache = SemanticCache()
+        # (chunk ids, embedding matrix, chunk id -> (document id, filename, text preview), HNSW
+        # index or None), built lazily and dropped whenever documents are re-indexed. Kept as one
+        # tuple under _matrix_lock so a query never pairs an index with another build's ids.
+        self._snapshot: tuple[np.ndarray, np.ndarray, dict[int, tuple[int, str, str]], Any] | None = None
+        self._question_vectors: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._question_lock = threading.Lock()
+        self._matrix_lock = threading.Lock()
 
     def load_and_index_documents(self) -> int:
         """
@@ -47,121 +342,448 @@ class VectorRAG:
             return 0
 
         session = self.db_manager.get_session()
-        indexed_count = 0
+        # (document id, chunk index, text) for every new chunk, embedded together below
+        pending: list[tuple[int, int, str]] = []
+        removed_ids: list[int] = []
 
         try:
-            for file_path in sorted(self.knowledge_dir.glob("*.md")):
-                content = file_path.read_text(encoding="utf-8")
-                content_hash = hashlib.sha256(content.encode()).hexdigest()
+            self._migrate_legacy_vectors(session)
+            self._reencode_stale_chunks(session)
 
-                # Check if document already exists
-                existing = session.query(RAGDocument).filter_by(content_hash=content_hash).first()
-                if existing:
-                    continue
+            documents = [(file_path, _hash_file(file_path)) for file_path in sorted(self.knowledge_dir.glob("*.md"))]
 
-                # Create document record
-                doc = RAGDocument(
-                    filename=file_path.name,
-                    content=content,
-                    content_hash=content_hash
+            # Drop documents whose files were deleted or renamed, along with their chunks; a
+            # renamed file is then indexed again under its new name below
+            removed_ids = session.scalars(
+                select(RAGDocument.id).where(
+                    RAGDocument.filename.not_in([file_path.name for file_path, _ in documents])
+                )
+            ).all()
+            if removed_ids:
+                session.execute(delete(RAGChunk).where(RAGChunk.document_id.in_(removed_ids)))
+                session.execute(delete(RAGDocument).where(RAGDocument.id.in_(removed_ids)))
+
+            # Look up which file contents are already indexed in one query
+            hashes = [content_hash for _, content_hash in documents]
+            existing = set(session.scalars(
+                select(RAGDocument.content_hash).where(RAGDocument.content_hash.in_(hashes))
+            ))
+            self._migrate_legacy_hashes(session, documents, existing)
+
+            new_documents = []
+            for file_path, content_hash in documents:
+                if content_hash not in existing:
+                    existing.add(content_hash)
+                    new_documents.append((file_path.name, _decode_document(file_path.read_bytes()), content_hash))
+
+            # Edited files keep their document row (filename is unique); only their chunks are replaced
+            indexed_ids = dict(session.execute(
+                select(RAGDocument.filename, RAGDocument.id).where(
+                    RAGDocument.filename.in_([filename for filename, _, _ in new_documents])
                 )
-                session.add(doc)
-                session.flush()
+            ).all())
 
-                # Split into chunks
+            for filename, content, content_hash in new_documents:
                 chunks = self._split_text(content)
-                for chunk_idx, chunk_text in enumerate(chunks):
-                    embedding = self.embedder.encode(chunk_text)
-                    embedding_json = json.dumps(embedding.tolist())
-
-                    chunk_record = RAGChunk(
-                        document_id=doc.id,
-                        chunk_index=chunk_idx,
-                        text=chunk_text,
-                        vector=embedding_json,
-                        embedding_model=EMBEDDING_MODEL
+
+                document_id = indexed_ids.get(filename)
+                if document_id is not None:
+                    session.execute(delete(RAGChunk).where(RAGChunk.document_id == document_id))
+                    session.execute(
+                        update(RAGDocument)
+                        .where(RAGDocument.id == document_id)
+                        .values(content=content, content_hash=content_hash, indexed_at=datetime.now(timezone.utc))
                     )
-                    session.add(chunk_record)
-                    indexed_count += 1
+                else:
+                    # Create document record
+                    doc = RAGDocument(
+                        filename=filename,
+                        content=content,
+                        content_hash=content_hash
+                    )
+                    session.add(doc)
+                    session.flush()
+                    document_id = doc.id
+                pending.extend((document_id, chunk_idx, chunk_text) for chunk_idx, chunk_text in enumerate(chunks))
+
+            if pending:
+                # One batched forward pass instead of one encode() call per chunk
+                embeddings = self.embedder.encode(
+                    [chunk_text for _, _, chunk_text in pending],
+                    batch_size=64,
+                    convert_to_numpy=True,
+                    show_progress_bar=False,
+                )
+                # One executemany INSERT without per-row ORM state
+                session.execute(
+                    insert(RAGChunk),
+                    [
+                        {
+                            "document_id": document_id,
+                            "chunk_index": chunk_idx,
+                            "text": chunk_text,
+                            "vector": _encode_vector(embedding),
+                            "embedding_model": self.embedding_model,
+                        }
+                        for (document_id, chunk_idx, chunk_text), embedding in zip(pending, embeddings)
+                    ],
+                )
 
             session.commit()
         finally:
             session.close()
 
-        return indexed_count
+        if pending or removed_ids:
+            # Edits can reuse freed chunk ids, so the saved matrix may no longer match its ids
+            (self.index_dir / "fingerprint.json").unlink(missing_ok=True)
+        with self._matrix_lock:
+            self._snapshot = None
+        return len(pending)
 
-    def retrieve(self, question: str, top_k: int = 3) -> list[RetrievedChunk]:
+    def _migrate_legacy_hashes(
+        self, session, documents: list[tuple[Path, str]], existing: set[str]
+    ) -> None:
         """
-        Retrieve most relevant chunks using vector similarity search.
+        Rewrite SHA-256 content hashes stored by older versions to the current hash, so
+        unchanged documents are recognised instead of indexed a second time.
         """
+        for file_path, content_hash in documents:
+            if content_hash in existing:
+                continue
+            legacy_hash = hashlib.sha256(_decode_document(file_path.read_bytes()).encode()).hexdigest()
+            migrated = session.execute(
+                update(RAGDocument)
+                .where(RAGDocument.content_hash == legacy_hash)
+                .values(content_hash=content_hash)
+            )
+            if migrated.rowcount:
+                existing.add(content_hash)
+
+    def _migrate_legacy_vectors(self, session) -> None:
+        """Re-encode chunk vectors that older versions stored as JSON text."""
+        # Legacy JSON starts with "[" and ends with "]"; the database filters on that, so
+        # a table without legacy rows costs one LIMIT 1 probe and transfers no vectors
+        legacy = "substr(vector, 1, 1) = '[' AND substr(vector, length(vector), 1) = ']'"
+        if session.execute(text(f"SELECT 1 FROM rag_chunks WHERE {legacy} LIMIT 1")).first() is None:
+            return
+        rows = session.execute(text(f"SELECT id, vector FROM rag_chunks WHERE {legacy}")).all()
+        for chunk_id, raw in rows:
+            vector = _legacy_vector(raw)
+            if vector is not None:
+                session.execute(
+                    update(RAGChunk)
+                    .where(RAGChunk.id == chunk_id)
+                    .values(vector=_encode_vector(vector))
+                )
+
+    def _reencode_stale_chunks(self, session) -> None:
+        """
+        Re-embed chunks indexed by a different embedder, e.g. after switching
+        RAG_EMBEDDING_BACKEND, so the stored vectors and question vectors always match.
+        """
+        stale = session.execute(
+            select(RAGChunk.id, RAGChunk.text).where(
+                (RAGChunk.embedding_model != self.embedding_model) | RAGChunk.embedding_model.is_(None)
+            )
+        ).all()
+        if not stale:
+            return
+        embeddings = self.embedder.encode(
+            [chunk_text for _, chunk_text in stale],
+            batch_size=64,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        # ORM bulk UPDATE by primary key: one executemany for all re-encoded chunks
+        session.execute(
+            update(RAGChunk),
+            [
+                {"id": chunk_id, "vector": _encode_vector(embedding), "embedding_model": self.embedding_model}
+                for (chunk_id, _), embedding in zip(stale, embeddings)
+            ],
+        )
+
+    def _encode_question(self, question: str) -> np.ndarray:
+        """Embed a question, reusing the vector for recently seen question text."""
+        with self._question_lock:
+            vector = self._question_vectors.get(question)
+            if vector is not None:
+                self._question_vectors.move_to_end(question)
+                return vector
+
+        vector = np.asarray(self.embedder.encode(question), dtype=np.float32)
+        vector.flags.writeable = False
+        with self._question_lock:
+            self._question_vectors[question] = vector
+            while len(self._question_vectors) > _QUESTION_CACHE_SIZE:
+                self._question_vectors.popitem(last=False)
+        return vector
+
+    def _embedding_matrix(self) -> tuple[np.ndarray, np.ndarray, dict[int, tuple[int, str, str]], Any]:
+        """
+        Return (chunk ids, embedding matrix, chunk metadata, HNSW index or None), loading them
+        on first use. The matrix holds the raw int8 codes when SimSIMD can score them,
+        otherwise unit-norm float32 rows.
+        """
+        with self._matrix_lock:
+            if self._snapshot is None:
+                chunk_ids, codes = self._load_codes()
+                meta = self._load_meta()
+                ann = self._load_ann(chunk_ids, codes)
+                # int8 keeps the scanned working set at a quarter of float32
+                matrix = codes if simsimd is not None else _unit_rows(codes)
+                self._snapshot = (chunk_ids, matrix, meta, ann)
+            return self._snapshot
+
+    def _load_meta(self) -> dict[int, tuple[int, str, str]]:
+        """Document id, filename and result text for every chunk that belongs to a document."""
+        session = self.db_manager.get_session()
+        try:
+            return {
+                chunk_id: (document_id, filename, preview)
+                for chunk_id, document_id, filename, preview in session.query(
+                    # Truncated by the database, so full chunk text is never transferred
+                    RAGChunk.id, RAGDocument.id, RAGDocument.filename, func.substr(RAGChunk.text, 1, 1500)
+                ).join(
+                    RAGDocument, RAGChunk.document_id == RAGDocument.id
+                )
+            }
+        finally:
+            session.close()
+
+    def _load_codes(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Chunk ids and their int8 embedding codes. Memory-maps the copy saved in index_dir when
+        its fingerprint matches the chunks in the database and the files on disk, otherwise
+        rebuilds and saves it. Validation only stats files and reads .npy headers, so a saved
+        matrix is never paged in at startup.
+        """
+        ids_path = self.index_dir / "embedding_ids.npy"
+        codes_path = self.index_dir / "embeddings.npy"
+        fingerprint_path = self.index_dir / "fingerprint.json"
         session = self.db_manager.get_session()
+        try:
+            count, max_id, indexed_at = session.execute(text(
+                "SELECT (SELECT COUNT(id) FROM rag_chunks), (SELECT MAX(id) FROM rag_chunks), "
+                "(SELECT MAX(indexed_at) FROM rag_documents)"
+            )).one()
+            # Changes with every insert, deletion and document edit, from any process
+            chunks_state = [count, max_id, str(indexed_at)]
+            if count:
+                try:
+                    fingerprint = json.loads(fingerprint_path.read_bytes())
+                    chunk_ids = np.load(ids_path)
+                    codes = np.load(codes_path, mmap_mode="r")
+                    if fingerprint == {
+                        "chunks": chunks_state,
+                        "files": _file_stamps(ids_path, codes_path),
+                        "shape": [len(chunk_ids), *codes.shape],
+                    }:
+                        return chunk_ids, codes
+                except Exception:
+                    pass
+            rows = session.execute(text("SELECT id, vector FROM rag_chunks")).all()
+        finally:
+            session.close()
 
+        if not rows:
+            return np.zeros(0, dtype=np.int64), np.zeros((0, 0), dtype=np.int8)
+        chunk_ids = np.fromiter((chunk_id for chunk_id, _ in rows), dtype=np.int64, count=len(rows))
+        # Per-vector scales cancel out of the cosine, so the int8 codes are used directly
+        codes = np.vstack([_decode_vector(raw)[0] for _, raw in rows])
         try:
-            # Encode question
-            question_embedding = self.embedder.encode(question)
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            for path, array in ((codes_path, codes), (ids_path, chunk_ids)):
+                partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                with partial.open("wb") as handle:
+                    np.save(handle, array)
+                os.replace(partial, path)
+            # Written last: the fingerprint is what marks the saved pair as current
+            fingerprint = {
+                "chunks": chunks_state,
+                "files": _file_stamps(ids_path, codes_path),
+                "shape": [len(chunk_ids), *codes.shape],
+            }
+            partial = fingerprint_path.with_name(f"{fingerprint_path.name}.{os.getpid()}.tmp")
+            partial.write_bytes(json.dumps(fingerprint).encode())
+            os.replace(partial, fingerprint_path)
+        except Exception as e:
+            print(f"Could not save embedding matrix: {e}")
+        return chunk_ids, codes
 
-            # Get all chunks with embeddings
-            chunks = session.query(RAGChunk, RAGDocument).join(
-                RAGDocument, RAGChunk.document_id == RAGDocument.id
-            ).all()
+    def _load_ann(self, chunk_ids: np.ndarray, codes: np.ndarray) -> Any:
+        """
+        HNSW index over the embedding matrix, labelled by chunk id. Reuses the index saved
+        in index_dir when it covers exactly the current chunks.
+        """
+        if hnswlib is None or len(chunk_ids) < _ANN_MIN_CHUNKS:
+            return None
 
-            if not chunks:
-                return []
-
-            # Calculate similarity scores
-            scored_chunks = []
-            for chunk, doc in chunks:
-                chunk_embedding = np.array(json.loads(chunk.vector))
-                similarity = float(np.dot(question_embedding, chunk_embedding) / (
-                    np.linalg.norm(question_embedding) * np.linalg.norm(chunk_embedding) + 1e-8
-                ))
-                scored_chunks.append((chunk, doc, similarity))
-
-            # Sort by similarity and return top-k
-            scored_chunks.sort(key=lambda x: x[2], reverse=True)
-
-            retrieved = []
-            for chunk, doc, score in scored_chunks[:top_k]:
-                if score > 0.1:  # Minimum similarity threshold
-                    retrieved.append(RetrievedChunk(
-                        document_id=doc.id,
-                        filename=doc.filename,
-                        text=chunk.text[:1500],
-                        similarity_score=round(score, 3)
-                    ))
-
-            return retrieved
+        # Rows are unit-norm, so inner-product distance is 1 - cosine similarity
+        path = self.index_dir / "hnsw.bin"
+        index = hnswlib.Index(space="ip", dim=codes.shape[1])
+        try:
+            index.load_index(str(path), max_elements=len(chunk_ids))
+            if sorted(index.get_ids_list()) == sorted(chunk_ids.tolist()):
+                index.set_ef(_ANN_EF)
+                return index
+        except Exception:
+            pass
+
+        index = hnswlib.Index(space="ip", dim=codes.shape[1])
+        index.init_index(max_elements=len(chunk_ids), M=16, ef_construction=64)
+        index.add_items(_unit_rows(codes), chunk_ids)
+        index.set_ef(_ANN_EF)
+        try:
+            index.save_index(str(path))
+        except Exception as e:
+            print(f"Could not save HNSW index: {e}")
+        return index
 
-        finally:
-            session.close()
+    def retrieve(self, question: str, top_k: int = 3) -> list[RetrievedChunk]:
+        """
+        Retrieve most relevant chunks using vector similarity search.
+        """
+        chunk_ids, matrix, meta, ann = self._embedding_matrix()
+        if not len(chunk_ids):
+            return []
+
+        # Quantize the question like the stored vectors
+        question_codes, _ = _quantize(self._encode_question(question))
+        question_embedding = question_codes.astype(np.float32)
+        question_embedding /= np.sqrt(np.vdot(question_embedding, question_embedding)) + 1e-8
+
+        if ann is not None and top_k <= _ANN_EF:
+            # Approximate top-k from a graph walk that visits a small subset of chunks
+            labels, distances = ann.knn_query(question_embedding, k=min(top_k, len(chunk_ids)))
+            candidates, similarities = labels[0], 1.0 - distances[0]
+        else:
+            # Exact: score every chunk in one pass, partially select the top-k, order just those
+            if matrix.dtype == np.int8:
+                # SimSIMD int8 cosine kernel (VNNI/NEON dot products over the raw codes)
+                scores = 1.0 - np.asarray(
+                    simsimd.cdist(question_codes[None, :], matrix, metric="cosine")
+                ).ravel()
+            else:
+                scores = matrix @ question_embedding
+            # Drop chunks under the threshold before selecting, so only plausible hits are ranked
+            top = np.flatnonzero(scores > _MIN_SIMILARITY)
+            if top_k < top.size:
+                top = top[np.argpartition(-scores[top], top_k - 1)[:top_k]]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            candidates, similarities = chunk_ids[top], scores[top]
+
+        keep = similarities > _MIN_SIMILARITY
+        wanted = candidates[keep].tolist()
+        if not wanted:
+            return []
+
+        # Results are built from the in-memory metadata; the query path never opens a session
+        results = []
+        for chunk_id, score in zip(wanted, similarities[keep].tolist()):
+            row = meta.get(chunk_id)
+            if row is None:
+                continue
+            document_id, filename, chunk_text = row
+            results.append(
+                RetrievedChunk(
+                    document_id=document_id,
+                    filename=filename,
+                    text=chunk_text,
+                    similarity_score=round(score, 3)
+                )
+            )
+        return results
 
     def answer(self, question: str, live_context: dict[str, Any]) -> dict[str, Any]:
         """
         Generate answer using RAG with live context.
         Falls back to rule-based response if LLM unavailable.
         """
+        # retrieve() only returns chunks above the relevance threshold
         chunks = self.retrieve(question)
-        context_blob = "\n\n".join([
-            f"[Source: {c.filename}, Relevance: {c.similarity_score}]\n{c.text}"
-            for c in chunks
-        ])
-
-        # Try LLM first
-        llm_response = self._try_llm(
-            question=question,
-            live_context=live_context,
-            retrieved=context_blob
-        )
+        sources = [c.filename for c in chunks]
+
+        # Try LLM first, unless nothing in the corpus matched: an empty retrieved block
+        # would only buy a paid round-trip for the same templated advice
+        llm_response = None
+        if chunks:
+            llm_response = self._try_llm(
+                question=question,
+                live_context=live_context,
+                retrieved=self._context_blob(chunks)
+            )
 
         if llm_response:
             return {
                 "answer": llm_response,
-                "sources": [c.filename for c in chunks],
+                "sources": sources,
                 "confidence": "high",
                 "method": "llm"
             }
 
         # Fall back to rule-based answer
+        return {
+            "answer": self._rule_based_answer(live_context),
+            "sources": sources,
+            "confidence": "medium",
+            "method": "rule-based"
+        }
+
+    async def answer_stream(self, question: str, live_context: dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream the answer as text fragments while the LLM generates it.
+        Yields the cached or rule-based answer in one piece when no LLM call is made.
+        """
+        chunks = await asyncio.to_thread(self.retrieve, question)
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not chunks or not api_key:
+            yield self._rule_based_answer(live_context)
+            return
+
+        retrieved = self._context_blob(chunks)
+        context_key = _context_key(live_context, retrieved)
+        question_vector = await asyncio.to_thread(self._encode_question, question)
+        cached = self.response_cache.get(context_key, question_vector)
+        if cached is not None:
+            yield cached
+            return
+
+        parts: list[str] = []
+        try:
+            from openai import AsyncOpenAI
+
+            client = AsyncOpenAI(api_key=api_key)
+            stream = await client.chat.completions.create(
+                **self._llm_request(question, live_context, retrieved), stream=True
+            )
+            async for event in stream:
+                if not event.choices:
+                    continue
+                delta = event.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            print(f"LLM error: {e}")
+            if not parts:
+                yield self._rule_based_answer(live_context)
+            return
+
+        if parts:
+            self.response_cache.put(context_key, question_vector, "".join(parts))
+
+    @staticmethod
+    def _context_blob(chunks: list[RetrievedChunk]) -> str:
+        """Format retrieved chunks as the knowledge block of the LLM prompt."""
+        return "\n\n".join([
+            f"[Source: {c.filename}, Relevance: {c.similarity_score}]\n{c.text}"
+            for c in chunks
+        ])
+
+    @staticmethod
+    def _rule_based_answer(live_context: dict[str, Any]) -> str:
+        """Templated answer built from the live risk assessment."""
         risk_level = live_context.get("risk_level", "UNKNOWN")
         risk_score = live_context.get("risk_score", "N/A")
         reasons = live_context.get("reasons", [])
@@ -171,42 +793,15 @@ class VectorRAG:
         reasoning = " ".join(reasons[:2]) if reasons else "Risk influenced by current environmental conditions."
         action_text = " ".join(actions[:2]) if actions else "Continue monitoring and inspect canopy closely."
 
-        answer = (
+        return (
             f"For your {crop}: Disease risk is **{risk_level}** (score: {risk_score}/100). "
             f"\n\nWhy: {reasoning} "
             f"\n\nAction: {action_text}"
         )
 
-        return {
-            "answer": answer,
-            "sources": [c.filename for c in chunks],
-            "confidence": "medium",
-            "method": "rule-based"
-        }
-
     def _split_text(self, text: str) -> list[str]:
         """Split text into chunks with overlap."""
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        chunks = []
-        current_chunk = []
-        current_length = 0
-
-        for sentence in sentences:
-            sentence_length = len(sentence.split())
-            if current_length + sentence_length > self.chunk_size:
-                if current_chunk:
-                    chunks.append(" ".join(current_chunk))
-                    # Keep overlap: last ~50% of previous chunk
-                    current_chunk = current_chunk[-len(current_chunk) // 2:]
-                    current_length = sum(len(s.split()) for s in current_chunk)
-
-            current_chunk.append(sentence)
-            current_length += sentence_length
-
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
-
-        return chunks
+        return _chunk_text(text, self.chunk_size)
 
     def _try_llm(self, question: str, live_context: dict[str, Any], retrieved: str) -> str | None:
         """Attempt to get response from OpenAI LLM."""
@@ -214,32 +809,45 @@ class VectorRAG:
         if not api_key:
             return None
 
+        context_key = _context_key(live_context, retrieved)
+        question_vector = self._encode_question(question)
+        cached = self.response_cache.get(context_key, question_vector)
+        if cached is not None:
+            return cached
+
         try:
             from openai import OpenAI
 
             client = OpenAI(api_key=api_key)
-            prompt = (
-                "You are AgriGuardian AI, an expert crop disease prediction assistant. "
-                "Use the retrieved agricultural knowledge and live telemetry data. "
-                "Provide concise, actionable recommendations.\n\n"
-                f"Live context: {json.dumps(live_context, indent=2)}\n\n"
-                f"Retrieved knowledge:\n{retrieved or 'No retrieved documents.'}\n\n"
-                f"Farmer question: {question}"
-            )
-
-            response = client.chat.completions.create(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Provide safe, evidence-based agricultural guidance grounded in agronomy."
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                max_tokens=500,
-            )
-            return response.choices[0].message.content
+            response = client.chat.completions.create(**self._llm_request(question, live_context, retrieved))
+            content = response.choices[0].message.content
+            if content:
+                self.response_cache.put(context_key, question_vector, content)
+            return content
         except Exception as e:
             print(f"LLM error: {e}")
             return None
+
+    @staticmethod
+    def _llm_request(question: str, live_context: dict[str, Any], retrieved: str) -> dict[str, Any]:
+        """Chat completion arguments shared by the blocking and streaming LLM paths."""
+        prompt = (
+            "You are AgriGuardian AI, an expert crop disease prediction assistant. "
+            "Use the retrieved agricultural knowledge and live telemetry data. "
+            "Provide concise, actionable recommendations.\n\n"
+            f"Live context: {json.dumps(live_context, indent=2)}\n\n"
+            f"Retrieved knowledge:\n{retrieved or 'No retrieved documents.'}\n\n"
+            f"Farmer question: {question}"
+        )
+        return {
+            "model": os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "Provide safe, evidence-based agricultural guidance grounded in agronomy."
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.3,
+            "max_tokens": 500,
+        }
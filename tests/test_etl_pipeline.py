@@ -0,0 +1,78 @@
+"""Tests for the ETL pipeline's batch processing paths."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.etl_pipeline import PathwayETLPipeline
+
+
+def _event(temperature: float, crop_type: str | None = "tomato", **overrides) -> dict:
+    event = {
+        "timestamp": "2026-02-26T10:00:00+00:00",
+        "crop_type": crop_type,
+        "temperature": temperature,
+        "humidity": 70.0,
+        "rain_forecast": 0.4,
+        "soil_moisture": 55.0,
+        "wind_speed": 2.0,
+        "leaf_wetness": 60.0,
+        "soil_temperature": 22.0,
+        "soil_ph": 6.5,
+        "solar_radiation": 500.0,
+    }
+    if crop_type is None:
+        del event["crop_type"]
+    event.update(overrides)
+    return event
+
+
+def test_process_events_skips_event_without_crop_type():
+    pipeline = PathwayETLPipeline(persist=False)
+    first, rice = _event(10.0), _event(20.0, "rice")
+
+    results = pipeline.process_events([first, _event(99.0, crop_type=None), rice])
+
+    assert [event for event, _ in results] == [first, rice]
+    assert [(reading.crop_type, reading.temperature) for _, reading in results] == [
+        ("tomato", 10.0),
+        ("rice", 20.0),
+    ]
+    assert results[1][1].rolling_temp_avg == pytest.approx(15.0)
+
+
+def test_process_events_skips_event_with_bad_reading():
+    pipeline = PathwayETLPipeline(persist=False)
+    events = [_event(10.0), _event(12.0, humidity="n/a"), _event(14.0, "rice")]
+
+    results = pipeline.process_events(events)
+
+    assert [reading.temperature for _, reading in results] == [10.0, 14.0]
+
+
+def test_column_path_matches_per_event_kernel():
+    events = [_event(18.0 + i % 7, "rice" if i % 3 else "tomato", humidity=60.0 + i) for i in range(40)]
+    events.insert(5, _event(30.0, crop_type=None))
+
+    columns = PathwayETLPipeline(window_size=15, persist=False).process_batch_vectorized(events)
+    kernel = PathwayETLPipeline(window_size=15, persist=False).process_batch(events)
+
+    assert len(columns) == len(kernel) == 40
+    for a, b in zip(columns, kernel):
+        assert a.crop_type == b.crop_type
+        assert a.weather_condition == b.weather_condition
+        assert a.humidity_alert == b.humidity_alert
+        assert a.rolling_temp_avg == pytest.approx(b.rolling_temp_avg)
+        assert a.rolling_humidity_avg == pytest.approx(b.rolling_humidity_avg)
+        assert a.anomaly_score == pytest.approx(b.anomaly_score)
+
+
+def test_close_shuts_down_worker_pool():
+    pipeline = PathwayETLPipeline(persist=False, workers=2)
+    pool = pipeline._pool
+    assert len(pipeline.process_events([_event(10.0), _event(20.0, "rice")])) == 2
+
+    pipeline.close()
+
+    assert pipeline._pool is None
+    assert pool._shutdown
@@ -0,0 +1,41 @@
+"""Tests for the disease risk engine."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import asdict
+
+from backend.risk_engine import DiseaseRiskEngine
+
+
+def _random_features(rng: random.Random) -> dict:
+    return {
+        "humidity": rng.uniform(40, 100),
+        "temperature": rng.uniform(10, 40),
+        "rain_forecast": rng.random(),
+        "soil_moisture": rng.uniform(30, 100),
+        "wind_speed": rng.uniform(0, 6),
+        "leaf_wetness": rng.uniform(30, 100),
+        "soil_temperature": rng.uniform(10, 35),
+        "soil_ph": rng.uniform(5, 8),
+        "solar_radiation": rng.uniform(100, 900),
+        "anomaly_score": rng.uniform(0, 2),
+        "crop_type": rng.choice(["Tomato", "rice", "potato", "wheat", "maize", "cotton", "unknown"]),
+    }
+
+
+def test_score_batch_matches_score():
+    rng = random.Random(7)
+    features = [_random_features(rng) for _ in range(500)]
+    sequential, batched = DiseaseRiskEngine(), DiseaseRiskEngine()
+
+    expected = [asdict(sequential.score(f)) for f in features]
+    # Split in two so alert transitions carry over between score_batch calls
+    batch = list(batched.score_batch(features[:230])) + list(batched.score_batch(features[230:]))
+
+    assert [asdict(result) for result in batch] == expected
+    assert sequential._last_level == batched._last_level
+
+
+def test_score_batch_empty():
+    assert len(DiseaseRiskEngine().score_batch([])) == 0
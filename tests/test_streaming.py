@@ -0,0 +1,66 @@
+"""Tests for typed event decoding on the ingest path."""
+
+from __future__ import annotations
+
+import asyncio
+
+import msgspec
+import pytest
+
+from backend.streaming import FileStreamSource, _decode_events
+
+_EVENT = (
+    '{"timestamp":"2026-02-26T10:00:00+00:00","crop_type":"rice","temperature":%s,"humidity":88.0,'
+    '"rain_forecast":0.7,"soil_moisture":70.0,"wind_speed":1.2,"leaf_wetness":85.0,'
+    '"soil_temperature":26.0,"soil_ph":6.1,"solar_radiation":300.0}'
+)
+
+
+def test_decode_single_event():
+    [event] = _decode_events((_EVENT % 29).encode())
+
+    assert event["crop_type"] == "rice"
+    assert event["temperature"] == 29.0
+    assert event["timestamp"] == "2026-02-26T10:00:00+00:00"
+
+
+def test_decode_array_skips_only_invalid_events():
+    missing_crop = '{"temperature": 20, "humidity": 50}'
+    payload = f"[{_EVENT % 21}, {missing_crop}, {_EVENT % 23}]"
+
+    assert [event["temperature"] for event in _decode_events(payload)] == [21.0, 23.0]
+
+
+def test_decode_coerces_numeric_strings_and_ignores_unknown_fields():
+    payload = (_EVENT % '"24.5"')[:-1] + ', "field_id": "north-7"}'
+
+    [event] = _decode_events(payload.encode())
+
+    assert event["temperature"] == 24.5
+    assert "field_id" not in event
+
+
+def test_decode_without_timestamp():
+    payload = (_EVENT % 20).replace('"timestamp":"2026-02-26T10:00:00+00:00",', "")
+
+    assert _decode_events(payload)[0]["timestamp"] is None
+
+
+def test_decode_malformed_json_raises():
+    with pytest.raises(msgspec.DecodeError):
+        _decode_events(b"{not json")
+
+
+def test_file_source_skips_bad_lines(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text("\n".join([_EVENT % 20, "{broken", '{"crop_type": "rice"}', _EVENT % 22]) + "\n")
+    source = FileStreamSource(file_path=str(path))
+
+    async def read() -> list[dict]:
+        try:
+            return await source.next_batch(10)
+        finally:
+            await source.close()
+
+    assert [event["temperature"] for event in asyncio.run(read())] == [20.0, 22.0]
+    assert source.exhausted
@@ -0,0 +1,127 @@
+"""Tests for knowledge base indexing and retrieval."""
+
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from backend import vector_rag  # noqa: E402
+from backend.db import DatabaseManager, RAGChunk, RAGDocument  # noqa: E402
+
+
+class _HashingEmbedder:
+    """Deterministic bag-of-words embedder, so tests need no model download."""
+
+    def encode(self, sentences, **kwargs):
+        def embed(sentence: str) -> np.ndarray:
+            vector = np.zeros(384, dtype=np.float32)
+            for word in sentence.lower().split():
+                bucket = int.from_bytes(hashlib.blake2b(word.strip(".,").encode(), digest_size=4).digest(), "little")
+                vector[bucket % 384] += 1.0
+            return vector
+
+        if isinstance(sentences, str):
+            return embed(sentences)
+        return np.stack([embed(sentence) for sentence in sentences])
+
+
+@pytest.fixture
+def make_rag(tmp_path, monkeypatch):
+    monkeypatch.setattr(vector_rag, "_get_embedder", _HashingEmbedder)
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'rag.db'}")
+    manager.create_tables()
+    knowledge_dir = tmp_path / "knowledge"
+    knowledge_dir.mkdir()
+
+    def make() -> vector_rag.VectorRAG:
+        return vector_rag.VectorRAG(knowledge_dir=knowledge_dir, db_manager=manager)
+
+    return manager, knowledge_dir, make
+
+
+def _chunk_texts(manager: DatabaseManager) -> list[str]:
+    session = manager.get_session()
+    try:
+        return [chunk.text for chunk in session.query(RAGChunk).order_by(RAGChunk.id)]
+    finally:
+        session.close()
+
+
+def test_edited_document_is_reindexed(make_rag):
+    manager, knowledge_dir, make = make_rag
+    (knowledge_dir / "blight.md").write_text("Tomato blight spreads in humid weather. Spray copper early.")
+    (knowledge_dir / "blast.md").write_text("Rice blast follows long leaf wetness. Drain the paddy.")
+    rag = make()
+    assert rag.load_and_index_documents() == 2
+    assert rag.retrieve("tomato blight copper", top_k=1)[0].filename == "blight.md"
+
+    (knowledge_dir / "blight.md").write_text("Potato late blight needs mancozeb after heavy rain.")
+    assert rag.load_and_index_documents() == 1
+
+    texts = _chunk_texts(manager)
+    assert not any("copper" in chunk for chunk in texts)
+    assert any("mancozeb" in chunk for chunk in texts)
+    session = manager.get_session()
+    try:
+        assert session.query(RAGDocument).count() == 2
+    finally:
+        session.close()
+
+    results = rag.retrieve("potato late blight mancozeb", top_k=1)
+    assert results[0].filename == "blight.md"
+    assert "mancozeb" in results[0].text
+
+    # A fresh instance (e.g. after a restart) indexes nothing and serves the edited text
+    restarted = make()
+    assert restarted.load_and_index_documents() == 0
+    assert "mancozeb" in restarted.retrieve("potato late blight mancozeb", top_k=1)[0].text
+
+
+def test_deleted_and_renamed_documents_are_dropped(make_rag):
+    manager, knowledge_dir, make = make_rag
+    (knowledge_dir / "blight.md").write_text("Tomato blight spreads in humid weather. Spray copper early.")
+    (knowledge_dir / "blast.md").write_text("Rice blast follows long leaf wetness. Drain the paddy.")
+    rag = make()
+    rag.load_and_index_documents()
+    rag.retrieve("rice blast", top_k=1)
+
+    (knowledge_dir / "blight.md").unlink()
+    (knowledge_dir / "blast.md").rename(knowledge_dir / "rice_blast.md")
+    rag.load_and_index_documents()
+
+    assert not any("copper" in chunk for chunk in _chunk_texts(manager))
+    assert {result.filename for result in rag.retrieve("tomato blight copper rice blast", top_k=5)} == {
+        "rice_blast.md"
+    }
+
+
+def test_knowledge_state_tracks_deletions(tmp_path):
+    from backend.rag_assistant import _knowledge_state
+
+    (tmp_path / "a.md").write_text("one")
+    (tmp_path / "b.md").write_text("two")
+    before = _knowledge_state(tmp_path)
+    (tmp_path / "a.md").unlink()
+    assert _knowledge_state(tmp_path) != before
+    assert [name for name, _, _ in _knowledge_state(tmp_path)] == ["b.md"]
+
+
+def test_saved_matrix_is_reused_until_chunks_change(make_rag):
+    manager, knowledge_dir, make = make_rag
+    (knowledge_dir / "blight.md").write_text("Tomato blight spreads in humid weather. Spray copper early.")
+    rag = make()
+    rag.load_and_index_documents()
+    rag.retrieve("tomato blight", top_k=1)
+
+    _, codes = make()._load_codes()
+    assert isinstance(codes, np.memmap)
+
+    (knowledge_dir / "blast.md").write_text("Rice blast follows long leaf wetness. Drain the paddy.")
+    make().load_and_index_documents()
+    chunk_ids, codes = rag._load_codes()
+    assert not isinstance(codes, np.memmap)
+    assert len(chunk_ids) == len(_chunk_texts(manager)) == 2